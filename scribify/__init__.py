@@ -1 +1,26 @@
 __version__ = "0.1.0"
+
+__all__ = [
+    "ChunkResult",
+    "TranscriptionResult",
+    "transcribe",
+    "transcribe_async",
+    "transcribe_many",
+]
+
+_LAZY_EXPORTS = {
+    "ChunkResult": ".result",
+    "TranscriptionResult": ".result",
+    "transcribe": ".api",
+    "transcribe_async": ".api",
+    "transcribe_many": ".api",
+}
+
+
+def __getattr__(name):
+    # Resolved on first access so `import scribify` stays cheap for the CLI.
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
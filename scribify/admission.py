@@ -0,0 +1,136 @@
+import asyncio
+import contextlib
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Optional, Tuple
+
+from .audio_utils import get_audio_format, probe_audio
+from .constants import (
+    ASSUMED_MIN_BITRATE_KBPS,
+    CHUNK_EXPORT_BITRATE_KBPS,
+    JOB_BASE_MEMORY_MB,
+    MAX_FILE_SIZE_MB,
+)
+from .frames import SPLITTABLE_FORMATS
+from .planner import model_max_duration_seconds
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ResourceEstimate:
+    memory_bytes: int
+    disk_bytes: int
+
+
+def estimate_job(
+    file_path: str, model: Optional[str] = None, strip_silence: bool = False
+) -> ResourceEstimate:
+    """Estimate the peak RAM and temp disk a transcription of ``file_path`` needs.
+
+    Files sent to the API as-is only cost their own size. MP3s cut on frame
+    boundaries are memory-mapped and copied out one chunk at a time, so they
+    cost a chunk of RAM and their size again on disk. Other chunked files
+    are decoded whole by pydub, so memory scales with the decoded PCM: the
+    decoded copy, a second copy while ffmpeg's output is read, and a third
+    when silence stripping builds the trimmed audio. Disk holds the upload
+    plus the exported chunks.
+    """
+    size = os.path.getsize(file_path)
+    info = probe_audio(file_path) or {}
+    duration = info.get("duration_seconds") or size * 8 / (ASSUMED_MIN_BITRATE_KBPS * 1000)
+    base = JOB_BASE_MEMORY_MB * _MB
+
+    limit = model_max_duration_seconds(model)
+    direct = size <= MAX_FILE_SIZE_MB * _MB and (limit is None or duration <= limit)
+    if direct and not strip_silence:
+        return ResourceEstimate(memory_bytes=base + size, disk_bytes=size)
+    if get_audio_format(file_path) in SPLITTABLE_FORMATS and not strip_silence:
+        chunk_bytes = min(size, MAX_FILE_SIZE_MB * _MB)
+        return ResourceEstimate(memory_bytes=base + chunk_bytes, disk_bytes=2 * size)
+
+    sample_rate = info.get("sample_rate") or 48000
+    channels = info.get("channels") or 2
+    pcm_bytes = duration * sample_rate * channels * 2
+    copies = 3 if strip_silence else 2
+    chunk_bytes = duration * CHUNK_EXPORT_BITRATE_KBPS * 1000 / 8
+    return ResourceEstimate(
+        memory_bytes=int(base + copies * pcm_bytes),
+        disk_bytes=int(size + chunk_bytes),
+    )
+
+
+class AdmissionController:
+    """First-come, first-served admission of jobs against RAM and disk budgets.
+
+    A job runs once its estimate fits next to the jobs already running. A job
+    larger than the whole budget still runs, but only on its own.
+    """
+
+    def __init__(self, memory_budget_bytes: int, disk_budget_bytes: int) -> None:
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self.memory_in_use = 0
+        self.disk_in_use = 0
+        self.running = 0
+        self._waiters: Deque[Tuple[ResourceEstimate, asyncio.Future]] = deque()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, future in self._waiters if not future.done())
+
+    def fits(self, estimate: ResourceEstimate) -> bool:
+        if self.running == 0:
+            return True
+        return (
+            self.memory_in_use + estimate.memory_bytes <= self.memory_budget_bytes
+            and self.disk_in_use + estimate.disk_bytes <= self.disk_budget_bytes
+        )
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, estimate: ResourceEstimate) -> AsyncIterator[None]:
+        await self.acquire(estimate)
+        try:
+            yield
+        finally:
+            self.release(estimate)
+
+    async def acquire(self, estimate: ResourceEstimate) -> None:
+        if not self.queued and self.fits(estimate):
+            self._take(estimate)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((estimate, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the waiter was cancelled; hand the slot back.
+                self.release(estimate)
+            else:
+                self._admit_waiting()
+            raise
+
+    def release(self, estimate: ResourceEstimate) -> None:
+        self.memory_in_use -= estimate.memory_bytes
+        self.disk_in_use -= estimate.disk_bytes
+        self.running -= 1
+        self._admit_waiting()
+
+    def _take(self, estimate: ResourceEstimate) -> None:
+        self.memory_in_use += estimate.memory_bytes
+        self.disk_in_use += estimate.disk_bytes
+        self.running += 1
+
+    def _admit_waiting(self) -> None:
+        while self._waiters:
+            estimate, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self.fits(estimate):
+                break
+            self._waiters.popleft()
+            self._take(estimate)
+            future.set_result(None)
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .config import Config
+from .constants import DEFAULT_CONCURRENCY
+from .result import TranscriptionResult
+from .transcriber import AudioSource, Transcriber
+
+# A batch entry is a source, or a ``(filename, source)`` pair for in-memory audio.
+BatchItem = Union[AudioSource, Tuple[str, AudioSource]]
+
+
+def _build_transcriber(
+    api_key: Optional[str], model: Optional[str], strip_silence: bool, use_async: bool
+) -> Transcriber:
+    from .cassette import with_cassette
+
+    config = Config.load(api_key=api_key, model=model, quiet=True, strip_silence=strip_silence)
+    if use_async:
+        from .api_client import AsyncOpenAITranscriptionClient as client_cls
+    else:
+        from .api_client import OpenAITranscriptionClient as client_cls
+    client = with_cassette(
+        config,
+        lambda: client_cls(api_key=config.api_key, model=config.model, timeout=config.timeout),
+        use_async,
+    )
+    return Transcriber(client=client, quiet=True, strip_silence=config.strip_silence)
+
+
+async def _close_client(transcriber: Transcriber) -> None:
+    # Async clients own a connection pool that must be closed on the loop that used it.
+    close = getattr(transcriber.client, "aclose", None)
+    if close is not None:
+        await close()
+
+
+def transcribe(
+    source: AudioSource,
+    *,
+    filename: Optional[str] = None,
+    model: Optional[str] = None,
+    api_key: Optional[str] = None,
+    strip_silence: bool = False,
+) -> TranscriptionResult:
+    """Transcribe a path, bytes or binary file object, blocking until done."""
+    transcriber = _build_transcriber(api_key, model, strip_silence, use_async=False)
+    return transcriber.transcribe_result(source, filename=filename)
+
+
+async def transcribe_async(
+    source: AudioSource,
+    *,
+    filename: Optional[str] = None,
+    model: Optional[str] = None,
+    api_key: Optional[str] = None,
+    strip_silence: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> TranscriptionResult:
+    """Transcribe on the caller's event loop with up to ``concurrency`` uploads."""
+    transcriber = _build_transcriber(api_key, model, strip_silence, use_async=True)
+    try:
+        return await transcriber.transcribe_async(
+            source, filename=filename, semaphore=asyncio.Semaphore(concurrency)
+        )
+    finally:
+        await _close_client(transcriber)
+
+
+async def transcribe_many(
+    sources: Iterable[BatchItem],
+    *,
+    model: Optional[str] = None,
+    api_key: Optional[str] = None,
+    strip_silence: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Union[TranscriptionResult, BaseException]]:
+    """Transcribe several sources with one client and one shared upload limit.
+
+    Results come back in input order. With ``return_exceptions`` a failed
+    source yields its exception instead of cancelling the batch. At most
+    ``concurrency`` sources are decoded and chunked at once.
+    """
+    transcriber = _build_transcriber(api_key, model, strip_silence, use_async=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    def _unpack(item: BatchItem) -> Tuple[Optional[str], AudioSource]:
+        if isinstance(item, tuple):
+            return item
+        return None, item
+
+    jobs = []
+    for item in sources:
+        filename, source = _unpack(item)
+        jobs.append(transcriber.transcribe_async(source, filename=filename, semaphore=semaphore))
+    try:
+        return await asyncio.gather(*jobs, return_exceptions=return_exceptions)
+    finally:
+        await _close_client(transcriber)
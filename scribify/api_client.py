@@ -1,17 +1,38 @@
-from typing import Any
+import asyncio
+import os
+from typing import Any, Optional, Tuple, Union
 
 from openai import (
     APIConnectionError,
     APIError as OpenAIAPIError,
+    APITimeoutError,
+    AsyncOpenAI,
     AuthenticationError,
     BadRequestError,
     OpenAI,
     RateLimitError,
 )
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from .constants import (
+    DEFAULT_MODEL,
+    MAX_FILE_SIZE_MB,
+    REQUEST_TIMEOUT_MIN_SECONDS,
+    REQUEST_TIMEOUT_SECONDS,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_SECONDS,
+    RETRY_MIN_SECONDS,
+)
+from .exceptions import APIError, ChunkTooLargeError
 
-from .constants import DEFAULT_MODEL, RETRY_MAX_ATTEMPTS, RETRY_MAX_SECONDS, RETRY_MIN_SECONDS
-from .exceptions import APIError
+# A path on disk, or the encoded audio itself.
+UploadSource = Union[str, "os.PathLike[str]", bytes]
 
 
 def _is_retryable(exc: Exception) -> bool:
@@ -25,34 +46,151 @@ def _is_retryable(exc: Exception) -> bool:
     return False
 
 
-class OpenAITranscriptionClient:
-    def __init__(self, api_key: str, model: str = DEFAULT_MODEL) -> None:
-        self.client = OpenAI(api_key=api_key)
-        self.model = model
-
-    @retry(
+def _retry_policy() -> dict:
+    return dict(
         retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(RETRY_MAX_ATTEMPTS),
         wait=wait_exponential(min=RETRY_MIN_SECONDS, max=RETRY_MAX_SECONDS),
         reraise=True,
     )
+
+
+def request_timeout(size_bytes: int, limit: float = REQUEST_TIMEOUT_SECONDS) -> float:
+    """Seconds to wait for one upload of ``size_bytes``, at most ``limit``."""
+    share = limit * size_bytes / (MAX_FILE_SIZE_MB * 1024 * 1024)
+    return min(max(share, REQUEST_TIMEOUT_MIN_SECONDS), limit)
+
+
+def _is_too_large(exc: Exception) -> bool:
+    status = getattr(exc, "status_code", None)
+    if status == 413:
+        return True
+    if isinstance(exc, BadRequestError):
+        message = str(exc).lower()
+        return any(
+            hint in message for hint in ("duration", "longer than", "too large", "content size")
+        )
+    return False
+
+
+def _translate_error(exc: Exception) -> Exception:
+    if _is_too_large(exc):
+        return ChunkTooLargeError("Audio chunk rejected as too large or too long.")
+    if isinstance(exc, APITimeoutError):
+        # Retrying at the same size would likely time out again; split it instead.
+        return ChunkTooLargeError("Audio chunk timed out.")
+    if isinstance(exc, (AuthenticationError, BadRequestError)):
+        return APIError("Authentication or request error.")
+    if _is_retryable(exc):
+        return exc
+    return APIError("Failed to transcribe audio.")
+
+
+def _read_upload(path: UploadSource) -> Tuple[str, bytes]:
+    with open(path, "rb") as handle:
+        return _upload_file(handle.read(), os.fspath(path))
+
+
+def _upload_file(source: bytes, filename: Optional[str]) -> Tuple[str, bytes]:
+    # The API infers the container from the file name, so bytes need one.
+    return (os.path.basename(filename or "audio.mp3"), source)
+
+
+def _result_text(result: Any) -> str:
+    if isinstance(result, str):
+        return result
+    if hasattr(result, "text"):
+        return result.text
+    return str(result)
+
+
+class OpenAITranscriptionClient:
+    def __init__(
+        self, api_key: str, model: str = DEFAULT_MODEL, timeout: float = REQUEST_TIMEOUT_SECONDS
+    ) -> None:
+        # The SDK's own retries would multiply with tenacity's.
+        self.client = OpenAI(api_key=api_key, max_retries=0, timeout=timeout)
+        self.model = model
+        self.timeout = timeout
+
     def transcribe_file(self, audio_file: str) -> str:
+        text, _ = self.transcribe_with_retries(audio_file)
+        return text
+
+    def transcribe_with_retries(
+        self, source: UploadSource, filename: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """Transcribe ``source`` and return the text with the number of retries used."""
+        for attempt in Retrying(**_retry_policy()):
+            with attempt:
+                text = self._request(source, filename)
+        return text, attempt.retry_state.attempt_number - 1
+
+    def _request(self, source: UploadSource, filename: Optional[str]) -> str:
         try:
-            with open(audio_file, "rb") as handle:
+            if isinstance(source, bytes):
                 result: Any = self.client.audio.transcriptions.create(
                     model=self.model,
-                    file=handle,
+                    file=_upload_file(source, filename),
                     response_format="text",
+                    timeout=request_timeout(len(source), self.timeout),
                 )
-        except (AuthenticationError, BadRequestError) as exc:
-            raise APIError("Authentication or request error.") from exc
+            else:
+                with open(source, "rb") as handle:
+                    result = self.client.audio.transcriptions.create(
+                        model=self.model,
+                        file=handle,
+                        response_format="text",
+                        timeout=request_timeout(os.fstat(handle.fileno()).st_size, self.timeout),
+                    )
         except Exception as exc:
-            if _is_retryable(exc):
+            translated = _translate_error(exc)
+            if translated is exc:
                 raise
-            raise APIError("Failed to transcribe audio.") from exc
+            raise translated from exc
+        return _result_text(result)
+
 
-        if isinstance(result, str):
-            return result
-        if hasattr(result, "text"):
-            return result.text
-        return str(result)
+class AsyncOpenAITranscriptionClient:
+    """Event-loop native counterpart of :class:`OpenAITranscriptionClient`."""
+
+    def __init__(
+        self, api_key: str, model: str = DEFAULT_MODEL, timeout: float = REQUEST_TIMEOUT_SECONDS
+    ) -> None:
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0, timeout=timeout)
+        self.model = model
+        self.timeout = timeout
+
+    async def transcribe_file(self, audio_file: str) -> str:
+        text, _ = await self.transcribe_with_retries(audio_file)
+        return text
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+    async def transcribe_with_retries(
+        self, source: UploadSource, filename: Optional[str] = None
+    ) -> Tuple[str, int]:
+        async for attempt in AsyncRetrying(**_retry_policy()):
+            with attempt:
+                text = await self._request(source, filename)
+        return text, attempt.retry_state.attempt_number - 1
+
+    async def _request(self, source: UploadSource, filename: Optional[str]) -> str:
+        try:
+            if isinstance(source, bytes):
+                upload = _upload_file(source, filename)
+            else:
+                upload = await asyncio.to_thread(_read_upload, source)
+            result: Any = await self.client.audio.transcriptions.create(
+                model=self.model,
+                file=upload,
+                response_format="text",
+                timeout=request_timeout(len(upload[1]), self.timeout),
+            )
+        except Exception as exc:
+            translated = _translate_error(exc)
+            if translated is exc:
+                raise
+            raise translated from exc
+        return _result_text(result)
@@ -1,15 +1,15 @@
+import json
 import os
-from typing import Dict
-
-from pydub import AudioSegment
-from pydub.utils import which
+import shutil
+import subprocess
+from typing import Dict, Optional
 
 from .constants import SUPPORTED_FORMATS
 from .exceptions import AudioFileError
 
 
 def _check_ffmpeg() -> None:
-    if not which("ffmpeg"):
+    if not shutil.which("ffmpeg"):
         raise AudioFileError("FFmpeg not found. Install with: apt-get install ffmpeg")
 
 
@@ -20,19 +20,79 @@ def get_file_size_mb(file_path: str) -> float:
     return size_bytes / (1024 * 1024)
 
 
-def validate_audio_file(file_path: str) -> None:
-    if not os.path.exists(file_path):
-        raise AudioFileError(f"Audio file not found: {file_path}")
-    ext = os.path.splitext(file_path)[1].lstrip(".").lower()
+def probe_audio(file_path: str) -> Optional[Dict[str, float]]:
+    """Read duration, sample rate and channels with ffprobe, without decoding.
+
+    Returns ``None`` when ffprobe is missing or cannot read the file; fields
+    the container does not report are omitted.
+    """
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        proc = subprocess.run(
+            [
+                ffprobe,
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "format=duration:stream=sample_rate,channels",
+                "-of",
+                "json",
+                file_path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30,
+        )
+        data = json.loads(proc.stdout)
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+
+    info: Dict[str, float] = {}
+    duration = data.get("format", {}).get("duration")
+    if duration is not None:
+        info["duration_seconds"] = float(duration)
+    streams = data.get("streams") or [{}]
+    for key in ("sample_rate", "channels"):
+        if streams[0].get(key) is not None:
+            info[key] = float(streams[0][key])
+    return info
+
+
+def get_duration_seconds(file_path: str) -> Optional[float]:
+    info = probe_audio(file_path)
+    if not info:
+        return None
+    return info.get("duration_seconds")
+
+
+def get_audio_format(file_name: str) -> str:
+    return os.path.splitext(file_name)[1].lstrip(".").lower()
+
+
+def validate_audio_format(file_name: str) -> None:
+    ext = get_audio_format(file_name)
     if ext and ext not in SUPPORTED_FORMATS:
         raise AudioFileError(
             f"Unsupported audio format: .{ext}. Supported: {', '.join(SUPPORTED_FORMATS)}"
         )
+
+
+def validate_audio_file(file_path: str) -> None:
+    if not os.path.exists(file_path):
+        raise AudioFileError(f"Audio file not found: {file_path}")
+    validate_audio_format(file_path)
     _check_ffmpeg()
 
 
 def get_audio_info(file_path: str) -> Dict[str, float]:
     validate_audio_file(file_path)
+    from pydub import AudioSegment
+
     try:
         audio = AudioSegment.from_file(file_path)
     except Exception as exc:
@@ -40,5 +100,5 @@ def get_audio_info(file_path: str) -> Dict[str, float]:
     return {
         "size_mb": get_file_size_mb(file_path),
         "duration_seconds": len(audio) / 1000.0,
-        "format": os.path.splitext(file_path)[1].lstrip(".").lower(),
+        "format": get_audio_format(file_path),
     }
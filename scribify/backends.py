@@ -0,0 +1,161 @@
+import importlib.util
+import io
+import logging
+import os
+import threading
+import time
+from typing import Optional, Protocol, Tuple
+
+from .audio_utils import get_duration_seconds
+from .constants import (
+    CHUNK_EXPORT_BITRATE_KBPS,
+    LOCAL_MAX_CLIP_SECONDS,
+    LOCAL_MODEL,
+    REMOTE_COOLDOWN_SECONDS,
+)
+from .exceptions import BackendError, ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionBackend(Protocol):
+    """What :class:`~scribify.transcriber.Transcriber` needs from an engine.
+
+    ``source`` is a path or the encoded audio bytes; ``filename`` names the
+    container for bytes. Implementations return the text and the number of
+    retries it took.
+    """
+
+    model: str
+
+    def transcribe_with_retries(
+        self, source, filename: Optional[str] = None
+    ) -> Tuple[str, int]: ...
+
+
+class LocalWhisperBackend:
+    """CPU-only transcription through faster-whisper, when it is installed."""
+
+    def __init__(self, model: str = LOCAL_MODEL, compute_type: str = "int8") -> None:
+        self.model = model
+        self.compute_type = compute_type
+        self._engine = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_available() -> bool:
+        # Importing faster-whisper pulls in ctranslate2; defer that to _load.
+        return importlib.util.find_spec("faster_whisper") is not None
+
+    def _load(self):
+        with self._lock:
+            if self._engine is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError as exc:
+                    raise BackendError(
+                        "Local transcription requires faster-whisper. "
+                        "Install with: pip install scribify[local]"
+                    ) from exc
+                self._engine = WhisperModel(
+                    self.model, device="cpu", compute_type=self.compute_type
+                )
+        return self._engine
+
+    def transcribe_file(self, audio_file: str) -> str:
+        text, _ = self.transcribe_with_retries(audio_file)
+        return text
+
+    def transcribe_with_retries(self, source, filename: Optional[str] = None) -> Tuple[str, int]:
+        engine = self._load()
+        audio = io.BytesIO(source) if isinstance(source, bytes) else os.fspath(source)
+        try:
+            segments, _ = engine.transcribe(audio)
+            text = " ".join(segment.text.strip() for segment in segments)
+        except Exception as exc:
+            raise BackendError("Local transcription failed.") from exc
+        return text.strip(), 0
+
+
+def _is_remote_unavailable(exc: Exception) -> bool:
+    from .api_client import _is_retryable
+
+    return _is_retryable(exc)
+
+
+class RoutingBackend:
+    """Send short clips to a local engine and the rest to the API.
+
+    When the API is rate-limited or unreachable after its own retries, the
+    clip spills over to the local engine and the API is skipped for
+    ``cooldown_seconds``.
+    """
+
+    def __init__(
+        self,
+        remote: TranscriptionBackend,
+        local: TranscriptionBackend,
+        max_local_seconds: float = LOCAL_MAX_CLIP_SECONDS,
+        cooldown_seconds: float = REMOTE_COOLDOWN_SECONDS,
+    ) -> None:
+        self.remote = remote
+        self.local = local
+        self.max_local_seconds = max_local_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._remote_blocked_until = 0.0
+
+    @property
+    def model(self) -> str:
+        return self.remote.model
+
+    def _duration_seconds(self, source) -> Optional[float]:
+        if isinstance(source, bytes):
+            # Chunks are exported at a fixed bitrate, so size is a fair estimate.
+            return len(source) * 8 / (CHUNK_EXPORT_BITRATE_KBPS * 1000)
+        return get_duration_seconds(os.fspath(source))
+
+    def transcribe_file(self, audio_file: str) -> str:
+        text, _ = self.transcribe_with_retries(audio_file)
+        return text
+
+    def transcribe_with_retries(self, source, filename: Optional[str] = None) -> Tuple[str, int]:
+        duration = self._duration_seconds(source)
+        if duration is not None and duration <= self.max_local_seconds:
+            return self.local.transcribe_with_retries(source, filename=filename)
+        if time.monotonic() < self._remote_blocked_until:
+            return self.local.transcribe_with_retries(source, filename=filename)
+        try:
+            return self.remote.transcribe_with_retries(source, filename=filename)
+        except Exception as exc:
+            if not _is_remote_unavailable(exc):
+                raise
+            logger.warning("API unavailable (%s); falling back to local transcription", exc)
+            self._remote_blocked_until = time.monotonic() + self.cooldown_seconds
+            return self.local.transcribe_with_retries(source, filename=filename)
+
+
+def create_backend(config) -> TranscriptionBackend:
+    """Build the backend selected by ``config.backend``, recorded or replayed
+    through ``config.cassette`` when one is set."""
+    from .cassette import with_cassette
+
+    return with_cassette(config, lambda: _create_engine(config))
+
+
+def _create_engine(config) -> TranscriptionBackend:
+    if config.backend in ("local", "auto") and not LocalWhisperBackend.is_available():
+        raise ConfigurationError(
+            f"Backend '{config.backend}' requires faster-whisper. "
+            "Install with: pip install scribify[local]"
+        )
+    if config.backend == "local":
+        return LocalWhisperBackend(model=config.local_model)
+
+    from .api_client import OpenAITranscriptionClient
+
+    remote = OpenAITranscriptionClient(
+        api_key=config.api_key, model=config.model, timeout=config.timeout
+    )
+    if config.backend == "auto":
+        return RoutingBackend(remote=remote, local=LocalWhisperBackend(model=config.local_model))
+    return remote
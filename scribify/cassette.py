@@ -0,0 +1,285 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import exceptions
+from .exceptions import APIError, CassetteError
+
+CASSETTE_VERSION = 1
+
+
+@dataclass
+class Interaction:
+    """One recorded API call: what came back and how long it took."""
+
+    key: str
+    model: str
+    size_bytes: int
+    latency: float
+    text: Optional[str] = None
+    retries: int = 0
+    # Name of the exception raised instead of returning text.
+    error: Optional[str] = None
+    message: Optional[str] = None
+
+
+def _read_source(source) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    with open(source, "rb") as handle:
+        return handle.read()
+
+
+def interaction_key(model: str, audio: bytes) -> str:
+    # Chunk files get random names each run, so requests are matched on content.
+    digest = hashlib.sha256(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(audio)
+    return digest.hexdigest()
+
+
+class Cassette:
+    """Recorded interactions stored as JSON lines, one per API call.
+
+    Repeated requests for the same audio replay in recorded order; once
+    those run out the last one repeats.
+    """
+
+    def __init__(self, path: str, interactions: Optional[List[Interaction]] = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, List[Interaction]] = defaultdict(list)
+        self._played: Dict[str, int] = defaultdict(int)
+        for interaction in interactions or []:
+            self._by_key[interaction.key].append(interaction)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        interactions = []
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                header = json.loads(handle.readline() or "{}")
+                if header.get("version") != CASSETTE_VERSION:
+                    raise CassetteError(f"Unsupported cassette format: {path}")
+                for line in handle:
+                    if line.strip():
+                        interactions.append(Interaction(**json.loads(line)))
+        except OSError as exc:
+            raise CassetteError(f"Cannot read cassette: {path}") from exc
+        except (TypeError, ValueError) as exc:
+            raise CassetteError(f"Corrupt cassette: {path}") from exc
+        return cls(path, interactions)
+
+    @classmethod
+    def create(cls, path: str) -> "Cassette":
+        """Start an empty cassette at ``path``, replacing any previous recording."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+        return cls(path)
+
+    def append(self, interaction: Interaction) -> None:
+        # Written as each call finishes so an interrupted recording stays usable.
+        with self._lock:
+            self._by_key[interaction.key].append(interaction)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(asdict(interaction)) + "\n")
+
+    def next(self, key: str) -> Optional[Interaction]:
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                return None
+            played = self._played[key]
+            self._played[key] = played + 1
+            return recorded[min(played, len(recorded) - 1)]
+
+    def latency_model(self) -> Tuple[float, float]:
+        """Least-squares ``(base seconds, seconds per byte)`` over successful calls."""
+        with self._lock:
+            points = [
+                (interaction.size_bytes, interaction.latency)
+                for recorded in self._by_key.values()
+                for interaction in recorded
+                if interaction.error is None
+            ]
+        if not points:
+            return 0.0, 0.0
+        count = len(points)
+        mean_size = sum(size for size, _ in points) / count
+        mean_latency = sum(latency for _, latency in points) / count
+        spread = sum((size - mean_size) ** 2 for size, _ in points)
+        if not spread:
+            return mean_latency, 0.0
+        per_byte = sum((size - mean_size) * (latency - mean_latency) for size, latency in points)
+        per_byte /= spread
+        return max(mean_latency - per_byte * mean_size, 0.0), max(per_byte, 0.0)
+
+
+def _outcome(interaction: Interaction) -> Tuple[str, int]:
+    if interaction.error is not None:
+        error_cls = getattr(exceptions, interaction.error, None)
+        if isinstance(error_cls, type) and issubclass(error_cls, exceptions.WhisperCLIError):
+            raise error_cls(interaction.message or "Recorded API error.")
+        # SDK errors (rate limits, dropped connections) replay as scribify's APIError.
+        raise APIError(f"{interaction.error}: {interaction.message or 'recorded API error'}")
+    return interaction.text or "", interaction.retries
+
+
+class RecordingClient:
+    """Pass calls through to ``inner`` and record each response and latency."""
+
+    def __init__(self, inner, cassette: Cassette) -> None:
+        self.inner = inner
+        self.cassette = cassette
+        self.model = getattr(inner, "model", "")
+
+    def transcribe_file(self, audio_file: str) -> str:
+        text, _ = self.transcribe_with_retries(audio_file)
+        return text
+
+    def transcribe_with_retries(self, source, filename: Optional[str] = None) -> Tuple[str, int]:
+        audio = _read_source(source)
+        started = time.perf_counter()
+        try:
+            text, retries = self.inner.transcribe_with_retries(source, filename=filename)
+        except Exception as exc:
+            self._record(audio, started, error=exc)
+            raise
+        self._record(audio, started, text=text, retries=retries)
+        return text, retries
+
+    def _record(self, audio: bytes, started: float, text=None, retries=0, error=None) -> None:
+        self.cassette.append(
+            Interaction(
+                key=interaction_key(self.model, audio),
+                model=self.model,
+                size_bytes=len(audio),
+                latency=time.perf_counter() - started,
+                text=text,
+                retries=retries,
+                error=type(error).__name__ if error is not None else None,
+                message=str(error) if error is not None else None,
+            )
+        )
+
+
+class AsyncRecordingClient(RecordingClient):
+    """:class:`RecordingClient` for event-loop native clients."""
+
+    async def transcribe_file(self, audio_file: str) -> str:
+        text, _ = await self.transcribe_with_retries(audio_file)
+        return text
+
+    async def aclose(self) -> None:
+        close = getattr(self.inner, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def transcribe_with_retries(
+        self, source, filename: Optional[str] = None
+    ) -> Tuple[str, int]:
+        audio = await asyncio.to_thread(_read_source, source)
+        started = time.perf_counter()
+        try:
+            text, retries = await self.inner.transcribe_with_retries(source, filename=filename)
+        except Exception as exc:
+            self._record(audio, started, error=exc)
+            raise
+        self._record(audio, started, text=text, retries=retries)
+        return text, retries
+
+
+class ReplayClient:
+    """Answer from a cassette instead of the API.
+
+    With ``realtime`` each call takes as long as it did when recorded, so
+    scheduling and concurrency behave as they did live; otherwise calls
+    return immediately. Audio that was never recorded raises
+    :class:`CassetteError`, unless ``synthesize_misses`` is set, in which
+    case it gets placeholder text and a latency predicted from the recorded
+    calls' size/latency fit. That lets a different chunking be replayed
+    against the same recording.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        model: str,
+        realtime: bool = True,
+        synthesize_misses: bool = False,
+    ) -> None:
+        self.cassette = cassette
+        self.model = model
+        self.realtime = realtime
+        self.synthesize_misses = synthesize_misses
+        self._latency = cassette.latency_model() if synthesize_misses else (0.0, 0.0)
+
+    def transcribe_file(self, audio_file: str) -> str:
+        text, _ = self.transcribe_with_retries(audio_file)
+        return text
+
+    def transcribe_with_retries(self, source, filename: Optional[str] = None) -> Tuple[str, int]:
+        interaction = self._lookup(_read_source(source))
+        if self.realtime:
+            time.sleep(interaction.latency)
+        return _outcome(interaction)
+
+    def _lookup(self, audio: bytes) -> Interaction:
+        key = interaction_key(self.model, audio)
+        interaction = self.cassette.next(key)
+        if interaction is not None:
+            return interaction
+        if not self.synthesize_misses:
+            raise CassetteError(
+                f"No recorded response for a {len(audio)}-byte upload to {self.model}; "
+                "re-record the cassette for this input."
+            )
+        base, per_byte = self._latency
+        return Interaction(
+            key=key,
+            model=self.model,
+            size_bytes=len(audio),
+            latency=base + per_byte * len(audio),
+            text=f"[unrecorded {len(audio)} bytes]",
+        )
+
+
+class AsyncReplayClient(ReplayClient):
+    """:class:`ReplayClient` that waits on the event loop instead of blocking."""
+
+    async def transcribe_file(self, audio_file: str) -> str:
+        text, _ = await self.transcribe_with_retries(audio_file)
+        return text
+
+    async def transcribe_with_retries(
+        self, source, filename: Optional[str] = None
+    ) -> Tuple[str, int]:
+        interaction = self._lookup(await asyncio.to_thread(_read_source, source))
+        if self.realtime:
+            await asyncio.sleep(interaction.latency)
+        return _outcome(interaction)
+
+
+def with_cassette(config, build_client: Callable[[], object], use_async: bool = False):
+    """Wrap or replace the client from ``build_client`` per ``config.cassette``."""
+    if not config.cassette:
+        return build_client()
+    if config.cassette_mode == "record":
+        recorder = AsyncRecordingClient if use_async else RecordingClient
+        return recorder(build_client(), Cassette.create(config.cassette))
+    replayer = AsyncReplayClient if use_async else ReplayClient
+    return replayer(
+        Cassette.load(config.cassette),
+        model=config.model,
+        realtime=config.cassette_mode == "replay",
+        synthesize_misses=config.synthesize_misses,
+    )
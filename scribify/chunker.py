@@ -1,51 +1,228 @@
-import math
+import io
+import mmap
 import os
+import threading
 import uuid
-from typing import List
+from typing import BinaryIO, List, Optional, Tuple, Union
 
 from pydub import AudioSegment
 
-from .audio_utils import get_file_size_mb
-from .constants import CHUNK_SIZE_MB, TEMP_CHUNK_DIR
+from .audio_utils import get_audio_format, get_file_size_mb
+from .constants import (
+    CHUNK_EXPORT_BITRATE_KBPS,
+    CHUNK_EXPORT_FORMAT,
+    CHUNK_SIZE_MB,
+    CHUNK_SIZE_SAFETY_RATIO,
+    MIN_CHUNK_MS,
+    TEMP_CHUNK_DIR,
+)
 from .exceptions import ChunkingError
+from .frames import MAX_MP3_FRAME_BYTES, SPLITTABLE_FORMATS, FrameRange, frame_ranges
+from .planner import plan_chunks
+from .vad import TimeMap
 
 
 class AudioChunker:
-    def __init__(self, chunk_size_mb: int = CHUNK_SIZE_MB) -> None:
+    def __init__(
+        self,
+        chunk_size_mb: int = CHUNK_SIZE_MB,
+        bitrate_kbps: int = CHUNK_EXPORT_BITRATE_KBPS,
+        max_duration_seconds: Optional[float] = None,
+        strip_silence: bool = False,
+    ) -> None:
         self.chunk_size_mb = chunk_size_mb
+        self.bitrate_kbps = bitrate_kbps
+        self.max_duration_seconds = max_duration_seconds
+        self.strip_silence = strip_silence
+        self.time_map: Optional[TimeMap] = None
+        # (start_ms, end_ms) of each exported chunk in the original recording.
+        self.spans: List[Tuple[int, int]] = []
         self.temp_dir = None
+        self._chunk_index = 0
+        self._lock = threading.Lock()
+
+    def chunk_audio(
+        self, file_path: Union[str, BinaryIO], format: Optional[str] = None
+    ) -> List[str]:
+        if not self.strip_silence and isinstance(file_path, str):
+            chunk_paths = self._split_frames(file_path, format)
+            if chunk_paths is not None:
+                return chunk_paths
 
-    def chunk_audio(self, file_path: str) -> List[str]:
         try:
-            audio = AudioSegment.from_file(file_path)
+            audio = AudioSegment.from_file(file_path, format)
         except Exception as exc:
             raise ChunkingError(f"Failed to load audio for chunking: {file_path}") from exc
 
-        file_size_mb = get_file_size_mb(file_path)
-        num_chunks = max(1, math.ceil(file_size_mb / float(self.chunk_size_mb)))
-        chunk_duration_ms = int(len(audio) / num_chunks)
+        self.time_map = None
+        if self.strip_silence:
+            from .vad import strip_silence
+
+            audio, self.time_map = strip_silence(audio)
+
+        spans = plan_chunks(
+            len(audio),
+            chunk_size_mb=self.chunk_size_mb,
+            bitrate_kbps=self.bitrate_kbps,
+            max_duration_seconds=self.max_duration_seconds,
+        )
+
+        self._new_temp_dir()
+        self._chunk_index = 0
+        self.spans = []
+
+        chunk_paths: List[str] = []
+        for start_ms, end_ms in spans:
+            chunk_paths.extend(self._export_span(audio, start_ms, end_ms))
+        return chunk_paths
+
+    def bisect_chunk(
+        self, source: Union[str, bytes], format: Optional[str] = None
+    ) -> List[Tuple[str, int, int]]:
+        """Split one chunk in half for a retry with smaller requests.
+
+        Returns ``(path, start_ms, end_ms)`` for each half, with offsets
+        relative to the start of ``source``.
+        """
+        pieces = self._bisect_frames(source, format)
+        if pieces is not None:
+            return pieces
+
+        handle = io.BytesIO(source) if isinstance(source, bytes) else source
+        try:
+            audio = AudioSegment.from_file(handle, format)
+        except Exception as exc:
+            raise ChunkingError("Failed to load chunk for re-splitting") from exc
+        duration_ms = len(audio)
+        if duration_ms < 2 * MIN_CHUNK_MS:
+            raise ChunkingError("Chunk is too short to split further")
+
+        with self._lock:
+            if not self.temp_dir:
+                self._new_temp_dir()
+        mid_ms = duration_ms // 2
+        pieces = []
+        for start_ms, end_ms in ((0, mid_ms), (mid_ms, duration_ms)):
+            name = f"split_{uuid.uuid4().hex[:8]}.{CHUNK_EXPORT_FORMAT}"
+            pieces.append((self._export(audio, start_ms, end_ms, name), start_ms, end_ms))
+        return pieces
+
+    def _split_frames(self, file_path: str, format: Optional[str]) -> Optional[List[str]]:
+        """Cut MP3 files on frame boundaries without decoding them.
 
-        source_ext = os.path.splitext(file_path)[1].lstrip(".").lower()
-        export_format = "mp3"
-        ext = export_format
+        Returns ``None`` when the file is not frame-splittable so the caller
+        falls back to decoding and re-encoding.
+        """
+        audio_format = format or get_audio_format(file_path)
+        if audio_format not in SPLITTABLE_FORMATS or not os.path.isfile(file_path):
+            return None
+        max_bytes = int(self.chunk_size_mb * 1024 * 1024 * CHUNK_SIZE_SAFETY_RATIO)
+        with open(file_path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                ranges = frame_ranges(data, max_bytes, self.max_duration_seconds)
+                if not ranges:
+                    return None
+                self._new_temp_dir()
+                self._chunk_index = 0
+                self.spans = []
+                self.time_map = None
+                chunk_paths = []
+                for frame_range in ranges:
+                    self._chunk_index += 1
+                    chunk_name = f"chunk_{self._chunk_index:03d}.{audio_format}"
+                    chunk_paths.append(self._copy_range(data, frame_range, chunk_name))
+        return chunk_paths
+
+    def _bisect_frames(
+        self, source: Union[str, bytes], format: Optional[str]
+    ) -> Optional[List[Tuple[str, int, int]]]:
+        audio_format = format or (get_audio_format(source) if isinstance(source, str) else "")
+        if audio_format not in SPLITTABLE_FORMATS:
+            return None
+        if isinstance(source, bytes):
+            return self._halve_frames(source, audio_format)
+        with open(source, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return self._halve_frames(data, audio_format)
+
+    def _halve_frames(self, data, audio_format: str) -> Optional[List[Tuple[str, int, int]]]:
+        # Half the bytes plus the largest possible frame always yields two ranges.
+        ranges = frame_ranges(data, len(data) // 2 + MAX_MP3_FRAME_BYTES)
+        if not ranges:
+            return None
+        if len(ranges) < 2 or ranges[-1].end_seconds * 1000 < 2 * MIN_CHUNK_MS:
+            raise ChunkingError("Chunk is too short to split further")
+        with self._lock:
+            if not self.temp_dir:
+                self._new_temp_dir()
+        pieces = []
+        for frame_range in ranges:
+            name = f"split_{uuid.uuid4().hex[:8]}.{audio_format}"
+            pieces.append(
+                (
+                    self._copy_range(data, frame_range, name, record_span=False),
+                    int(frame_range.start_seconds * 1000),
+                    int(frame_range.end_seconds * 1000),
+                )
+            )
+        return pieces
+
+    def _copy_range(
+        self, data, frame_range: FrameRange, chunk_name: str, record_span: bool = True
+    ) -> str:
+        chunk_path = os.path.join(self.temp_dir, chunk_name)
+        try:
+            with open(chunk_path, "wb") as out:
+                out.write(memoryview(data)[frame_range.start : frame_range.end])
+        except OSError as exc:
+            raise ChunkingError(f"Failed to write chunk {chunk_name}") from exc
+        if record_span:
+            self.spans.append(
+                (int(frame_range.start_seconds * 1000), int(frame_range.end_seconds * 1000))
+            )
+        return chunk_path
+
+    def _new_temp_dir(self) -> None:
         run_id = uuid.uuid4().hex[:8]
         self.temp_dir = os.path.join(TEMP_CHUNK_DIR, f"run_{run_id}")
         os.makedirs(self.temp_dir, exist_ok=True)
 
-        chunk_paths: List[str] = []
-        for idx in range(num_chunks):
-            start_ms = idx * chunk_duration_ms
-            end_ms = len(audio) if idx == num_chunks - 1 else (idx + 1) * chunk_duration_ms
-            chunk = audio[start_ms:end_ms]
-            chunk_name = f"chunk_{idx + 1:03d}.{ext}"
-            chunk_path = os.path.join(self.temp_dir, chunk_name)
-            try:
-                chunk.export(chunk_path, format=export_format)
-            except Exception as exc:
-                raise ChunkingError(f"Failed to export chunk {chunk_name}") from exc
-            chunk_paths.append(chunk_path)
+    def _export(self, audio: AudioSegment, start_ms: int, end_ms: int, chunk_name: str) -> str:
+        chunk_path = os.path.join(self.temp_dir, chunk_name)
+        try:
+            audio[start_ms:end_ms].export(
+                chunk_path,
+                format=CHUNK_EXPORT_FORMAT,
+                bitrate=f"{self.bitrate_kbps}k",
+            )
+        except Exception as exc:
+            raise ChunkingError(f"Failed to export chunk {chunk_name}") from exc
+        return chunk_path
 
-        return chunk_paths
+    def _export_span(self, audio: AudioSegment, start_ms: int, end_ms: int) -> List[str]:
+        self._chunk_index += 1
+        chunk_name = f"chunk_{self._chunk_index:03d}.{CHUNK_EXPORT_FORMAT}"
+        chunk_path = self._export(audio, start_ms, end_ms, chunk_name)
+
+        if get_file_size_mb(chunk_path) <= self.chunk_size_mb:
+            if self.time_map is not None:
+                self.spans.append(
+                    (self.time_map.to_original(start_ms), self.time_map.to_original(end_ms))
+                )
+            else:
+                self.spans.append((start_ms, end_ms))
+            return [chunk_path]
+
+        # The encoder overshot the planned size; bisect only this span.
+        os.remove(chunk_path)
+        if end_ms - start_ms < 2 * MIN_CHUNK_MS:
+            raise ChunkingError(f"Chunk {chunk_name} exceeds {self.chunk_size_mb} MB")
+        mid_ms = (start_ms + end_ms) // 2
+        return self._export_span(audio, start_ms, mid_ms) + self._export_span(audio, mid_ms, end_ms)
 
     def cleanup_chunks(self, chunk_paths: List[str]) -> None:
         errors = []
@@ -1,14 +1,20 @@
 import logging
 import sys
-from typing import Optional
+from typing import List, Optional
 
 import click
-from dotenv import load_dotenv
 
-from .api_client import OpenAITranscriptionClient
 from .config import Config
+from .constants import (
+    BACKENDS,
+    CASSETTE_MODES,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_SEARCH_INDEX,
+    FOLLOW_IDLE_SECONDS,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_INDEX_ENV_VAR,
+)
 from .exceptions import WhisperCLIError
-from .transcriber import Transcriber
 
 
 def _configure_logging(verbose: bool) -> None:
@@ -16,28 +22,143 @@ def _configure_logging(verbose: bool) -> None:
     logging.basicConfig(level=level, format="%(message)s")
 
 
-@click.command()
-@click.argument("audio_file", type=click.Path(exists=True))
+class _DefaultCommandGroup(click.Group):
+    """Treat ``scribify FILE ...`` as ``scribify transcribe FILE ...``."""
+
+    default_command = "transcribe"
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+def _engine_options(func):
+    for option in reversed(
+        [
+            click.option("-m", "--model", help="Model override"),
+            click.option("--chunk-size", type=int, help="Chunk size in MB"),
+            click.option("--backend", type=click.Choice(BACKENDS), help="Transcription engine"),
+            click.option("--local-model", help="Local engine model (faster-whisper)"),
+            click.option("--strip-silence", is_flag=True, help="Cut long silences before upload"),
+            click.option(
+                "--cassette",
+                type=click.Path(dir_okay=False),
+                help="Record API responses to, or replay them from, this file",
+            ),
+            click.option(
+                "--cassette-mode",
+                type=click.Choice(CASSETTE_MODES),
+                help="record, replay at recorded speed (default) or replay instantly",
+            ),
+            click.option(
+                "--synthesize-misses",
+                is_flag=True,
+                help="When replaying, fake responses for audio missing from the cassette",
+            ),
+            click.option("-v", "--verbose", is_flag=True, help="Verbose logging"),
+        ]
+    ):
+        func = option(func)
+    return func
+
+
+def _build_transcriber(
+    model: Optional[str],
+    chunk_size: Optional[int],
+    backend: Optional[str],
+    local_model: Optional[str],
+    strip_silence: bool,
+    cassette: Optional[str],
+    cassette_mode: Optional[str],
+    synthesize_misses: bool,
+    verbose: bool,
+    quiet: bool,
+):
+    # Heavy dependencies are imported here so `--help` and argument errors
+    # never pay for openai/tenacity/dotenv at startup.
+    from dotenv import load_dotenv
+
+    from .backends import create_backend
+    from .transcriber import Transcriber
+
+    load_dotenv()
+    config = Config.load(
+        model=model,
+        chunk_size_mb=chunk_size,
+        verbose=verbose,
+        quiet=quiet,
+        strip_silence=strip_silence,
+        backend=backend,
+        local_model=local_model,
+        cassette=cassette,
+        cassette_mode=cassette_mode,
+        synthesize_misses=synthesize_misses,
+    )
+    _configure_logging(config.verbose)
+    client = create_backend(config)
+    return Transcriber(client=client, quiet=config.quiet, strip_silence=config.strip_silence)
+
+
+@click.group(cls=_DefaultCommandGroup)
+def main() -> None:
+    """Transcribe audio with OpenAI, chunking large files automatically."""
+
+
+@main.command()
+@click.argument("audio_file", type=click.Path(exists=True, allow_dash=True))
 @click.option("-o", "--output", help="Output file path")
-@click.option("-m", "--model", help="Model override")
-@click.option("--chunk-size", type=int, help="Chunk size in MB")
 @click.option("-q", "--quiet", is_flag=True, help="Suppress progress")
-@click.option("-v", "--verbose", is_flag=True, help="Verbose logging")
-def main(
+@click.option(
+    "-f", "--follow", is_flag=True, help="Transcribe a file still being recorded as it grows"
+)
+@click.option(
+    "--idle-timeout",
+    type=float,
+    default=FOLLOW_IDLE_SECONDS,
+    show_default=True,
+    help="With --follow, finish once the file stops growing for this many seconds",
+)
+@_engine_options
+def transcribe(
     audio_file: str,
     output: Optional[str],
+    quiet: bool,
+    follow: bool,
+    idle_timeout: float,
     model: Optional[str],
     chunk_size: Optional[int],
-    quiet: bool,
+    backend: Optional[str],
+    local_model: Optional[str],
+    strip_silence: bool,
+    cassette: Optional[str],
+    cassette_mode: Optional[str],
+    synthesize_misses: bool,
     verbose: bool,
 ) -> None:
+    """Transcribe AUDIO_FILE, or stdin when it is '-' (the default command)."""
+    if follow and audio_file == "-":
+        raise click.UsageError("--follow needs a file path, not stdin.")
     try:
-        load_dotenv()
-        config = Config.load(model=model, chunk_size_mb=chunk_size, verbose=verbose, quiet=quiet)
-        _configure_logging(config.verbose)
-        client = OpenAITranscriptionClient(api_key=config.api_key, model=config.model)
-        transcriber = Transcriber(client=client, quiet=config.quiet)
-        transcript = transcriber.transcribe(audio_file)
+        transcriber = _build_transcriber(
+            model,
+            chunk_size,
+            backend,
+            local_model,
+            strip_silence,
+            cassette,
+            cassette_mode,
+            synthesize_misses,
+            verbose,
+            quiet,
+        )
+        if follow:
+            _follow(transcriber, audio_file, output, idle_timeout)
+            return
+        if audio_file == "-":
+            transcript = transcriber.transcribe_stream(sys.stdin.buffer).text
+        else:
+            transcript = transcriber.transcribe(audio_file)
 
         if output:
             with open(output, "w", encoding="utf-8") as handle:
@@ -52,5 +173,130 @@ def main(
         sys.exit(1)
 
 
+def _follow(transcriber, audio_file: str, output: Optional[str], idle_timeout: float) -> None:
+    # Text is appended chunk by chunk so it can be read while recording continues.
+    handle = open(output, "w", encoding="utf-8") if output else None
+
+    def emit(chunk) -> None:
+        text = chunk.text.strip()
+        if not text:
+            return
+        if handle is None:
+            click.echo(text)
+        else:
+            handle.write(text + "\n")
+            handle.flush()
+
+    try:
+        transcriber.transcribe_follow(audio_file, on_chunk=emit, idle_timeout=idle_timeout)
+    finally:
+        if handle is not None:
+            handle.close()
+
+
+@main.command()
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--output-dir", help="Where transcripts go (default: DIRECTORY/transcripts)")
+@click.option("--processed-dir", help="Where finished inputs go (default: DIRECTORY/processed)")
+@click.option("--workers", type=int, default=DEFAULT_CONCURRENCY, help="Files transcribed at once")
+@click.option("--poll", is_flag=True, help="Poll the directory instead of using inotify")
+@_engine_options
+def watch(
+    directory: str,
+    output_dir: Optional[str],
+    processed_dir: Optional[str],
+    workers: int,
+    poll: bool,
+    model: Optional[str],
+    chunk_size: Optional[int],
+    backend: Optional[str],
+    local_model: Optional[str],
+    strip_silence: bool,
+    cassette: Optional[str],
+    cassette_mode: Optional[str],
+    synthesize_misses: bool,
+    verbose: bool,
+) -> None:
+    """Transcribe audio files as they land in DIRECTORY."""
+    try:
+        from .watcher import FolderWatcher
+
+        transcriber = _build_transcriber(
+            model,
+            chunk_size,
+            backend,
+            local_model,
+            strip_silence,
+            cassette,
+            cassette_mode,
+            synthesize_misses,
+            verbose,
+            quiet=True,
+        )
+        watcher = FolderWatcher(
+            transcriber,
+            directory,
+            output_dir=output_dir,
+            processed_dir=processed_dir,
+            workers=workers,
+            use_inotify=not poll,
+        )
+        watcher.run()
+    except WhisperCLIError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        click.echo("Stopped.", err=True)
+
+
+def _format_ms(ms: int) -> str:
+    minutes, seconds = divmod(ms // 1000, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+@main.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option(
+    "--index",
+    "index_path",
+    envvar=SEARCH_INDEX_ENV_VAR,
+    default=DEFAULT_SEARCH_INDEX,
+    show_default=True,
+    help="Search index database",
+)
+@click.option(
+    "--sync",
+    "sync_dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="First index new or changed {job_id}.txt transcripts in this directory",
+)
+@click.option("-n", "--limit", type=int, default=SEARCH_DEFAULT_LIMIT, help="Maximum results")
+def search(query: List[str], index_path: str, sync_dir: Optional[str], limit: int) -> None:
+    """Search stored transcripts for QUERY, best match first."""
+    from .search import TranscriptIndex
+
+    try:
+        index = TranscriptIndex(index_path)
+        try:
+            if sync_dir:
+                indexed = index.sync_directory(sync_dir)
+                click.echo(f"Indexed {indexed} transcript(s).", err=True)
+            hits = index.search(" ".join(query), limit=limit)
+        finally:
+            index.close()
+    except WhisperCLIError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+
+    for hit in hits:
+        position = ""
+        if hit.start_ms is not None and hit.end_ms is not None:
+            position = f"  [{_format_ms(hit.start_ms)}-{_format_ms(hit.end_ms)}]"
+        click.echo(f"{hit.job_id}{position}  {hit.snippet}")
+    if not hits:
+        click.echo("No matches.", err=True)
+
+
 if __name__ == "__main__":
     main()
@@ -2,7 +2,20 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
-from .constants import CHUNK_SIZE_MB, DEFAULT_MODEL, OPENAI_ENV_VAR
+from .constants import (
+    BACKENDS,
+    CASSETTE_ENV_VAR,
+    CASSETTE_MISSES_ENV_VAR,
+    CASSETTE_MODE_ENV_VAR,
+    CASSETTE_MODES,
+    CHUNK_SIZE_MB,
+    DEFAULT_BACKEND,
+    DEFAULT_MODEL,
+    LOCAL_MODEL,
+    OPENAI_ENV_VAR,
+    OPENAI_TIMEOUT_ENV_VAR,
+    REQUEST_TIMEOUT_SECONDS,
+)
 from .exceptions import ConfigurationError
 
 
@@ -13,6 +26,13 @@ class Config:
     chunk_size_mb: int = CHUNK_SIZE_MB
     verbose: bool = False
     quiet: bool = False
+    strip_silence: bool = False
+    backend: str = DEFAULT_BACKEND
+    local_model: str = LOCAL_MODEL
+    cassette: Optional[str] = None
+    cassette_mode: str = "replay"
+    synthesize_misses: bool = False
+    timeout: float = REQUEST_TIMEOUT_SECONDS
 
     @classmethod
     def load(
@@ -22,18 +42,52 @@ class Config:
         chunk_size_mb: Optional[int] = None,
         verbose: bool = False,
         quiet: bool = False,
+        strip_silence: bool = False,
+        backend: Optional[str] = None,
+        local_model: Optional[str] = None,
+        cassette: Optional[str] = None,
+        cassette_mode: Optional[str] = None,
+        synthesize_misses: bool = False,
     ) -> "Config":
-        resolved_key = api_key or os.getenv(OPENAI_ENV_VAR)
-        if not resolved_key:
+        resolved_backend = backend or DEFAULT_BACKEND
+        if resolved_backend not in BACKENDS:
+            raise ConfigurationError(
+                f"Unknown backend: {resolved_backend}. Choose from: {', '.join(BACKENDS)}"
+            )
+        resolved_cassette = cassette or os.getenv(CASSETTE_ENV_VAR) or None
+        resolved_mode = cassette_mode or os.getenv(CASSETTE_MODE_ENV_VAR) or "replay"
+        if resolved_mode not in CASSETTE_MODES:
+            raise ConfigurationError(
+                f"Unknown cassette mode: {resolved_mode}. Choose from: {', '.join(CASSETTE_MODES)}"
+            )
+        replaying = resolved_cassette is not None and resolved_mode != "record"
+        resolved_key = api_key or os.getenv(OPENAI_ENV_VAR) or ""
+        if not resolved_key and resolved_backend != "local" and not replaying:
             raise ConfigurationError(f"Missing API key. Set {OPENAI_ENV_VAR}.")
         resolved_model = model or DEFAULT_MODEL
         resolved_chunk = chunk_size_mb or CHUNK_SIZE_MB
         if resolved_chunk <= 0:
             raise ConfigurationError("Chunk size must be a positive integer (MB).")
+        try:
+            resolved_timeout = float(os.getenv(OPENAI_TIMEOUT_ENV_VAR) or REQUEST_TIMEOUT_SECONDS)
+        except ValueError:
+            resolved_timeout = 0
+        if resolved_timeout <= 0:
+            raise ConfigurationError(
+                f"{OPENAI_TIMEOUT_ENV_VAR} must be a positive number of seconds."
+            )
         return cls(
             api_key=resolved_key,
             model=resolved_model,
             chunk_size_mb=resolved_chunk,
             verbose=verbose,
             quiet=quiet,
+            strip_silence=strip_silence,
+            backend=resolved_backend,
+            local_model=local_model or LOCAL_MODEL,
+            cassette=resolved_cassette,
+            cassette_mode=resolved_mode,
+            synthesize_misses=synthesize_misses
+            or os.getenv(CASSETTE_MISSES_ENV_VAR, "").lower() == "synthesize",
+            timeout=resolved_timeout,
         )
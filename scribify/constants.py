@@ -6,6 +6,80 @@ SUPPORTED_FORMATS = ["mp3", "wav", "m4a", "aac", "flac", "ogg", "wma"]
 RETRY_MAX_ATTEMPTS = 3
 RETRY_MIN_SECONDS = 1
 RETRY_MAX_SECONDS = 10
+# A full-size upload may take OPENAI_TIMEOUT seconds; smaller ones get a
+# proportional share, but never less than the minimum.
+OPENAI_TIMEOUT_ENV_VAR = "OPENAI_TIMEOUT"
+REQUEST_TIMEOUT_SECONDS = 300
+REQUEST_TIMEOUT_MIN_SECONDS = 30
+# How many times a rejected chunk may be halved before the error is surfaced.
+MAX_RESPLIT_DEPTH = 3
 
 OPENAI_ENV_VAR = "OPENAI_API_KEY"
 TEMP_CHUNK_DIR = "temp_chunks"
+
+CHUNK_EXPORT_FORMAT = "mp3"
+CHUNK_EXPORT_BITRATE_KBPS = 128
+# Fraction of the chunk size budget the planner aims for; the rest absorbs
+# container overhead and encoder padding.
+CHUNK_SIZE_SAFETY_RATIO = 0.95
+MIN_CHUNK_MS = 1000
+
+# The API rejects requests longer than 1500 s for these models; leave headroom.
+MODEL_MAX_DURATION_SECONDS = {
+    "gpt-4o-transcribe": 1400,
+    "gpt-4o-mini-transcribe": 1400,
+}
+
+VAD_FRAME_MS = 30
+VAD_MIN_SILENCE_MS = 1000
+VAD_PADDING_MS = 250
+VAD_MIN_THRESHOLD_DBFS = -60.0
+VAD_NOISE_MARGIN_DB = 10.0
+VAD_SPEECH_RANGE_DB = 25.0
+
+# Uploads in flight at once for the async and batch APIs.
+DEFAULT_CONCURRENCY = 4
+
+BACKENDS = ["openai", "local", "auto"]
+DEFAULT_BACKEND = "openai"
+LOCAL_MODEL = "base"
+# Clips up to this length go to the local engine when routing automatically.
+LOCAL_MAX_CLIP_SECONDS = 60
+# After a rate limit or outage, route everything locally for this long.
+REMOTE_COOLDOWN_SECONDS = 60
+
+# Directory rescan interval for `scribify watch` without inotify.
+WATCH_POLL_SECONDS = 2.0
+
+# Pipe read size for streamed input.
+STREAM_READ_BYTES = 64 * 1024
+# Lines of ffmpeg's stderr kept for the error message when decoding fails.
+STREAM_STDERR_TAIL_LINES = 20
+
+# Web admission control: jobs wait until their estimated peak RAM and temp disk
+# fit these budgets (MB), overridable through the environment.
+MEMORY_BUDGET_ENV_VAR = "SCRIBIFY_MEMORY_BUDGET_MB"
+DISK_BUDGET_ENV_VAR = "SCRIBIFY_DISK_BUDGET_MB"
+DEFAULT_MEMORY_BUDGET_MB = 1536
+DEFAULT_DISK_BUDGET_MB = 1536
+# Fixed per-job overhead: interpreter objects, HTTP buffers, ffmpeg process.
+JOB_BASE_MEMORY_MB = 64
+# Lowest bitrate assumed when a file's duration cannot be probed.
+ASSUMED_MIN_BITRATE_KBPS = 32
+
+# Full-text index of finished transcripts, shared by the web app and `scribify search`.
+SEARCH_INDEX_ENV_VAR = "SCRIBIFY_SEARCH_INDEX"
+DEFAULT_SEARCH_INDEX = "/tmp/scribify-results/transcripts.sqlite3"
+SEARCH_DEFAULT_LIMIT = 20
+
+# `--follow`: shorter chunks so text appears roughly this long after the audio.
+FOLLOW_CHUNK_SECONDS = 60
+# Give up on a followed file that stops growing without being closed.
+FOLLOW_IDLE_SECONDS = 30.0
+
+# Record/replay of API responses for offline, reproducible profiling runs.
+CASSETTE_ENV_VAR = "SCRIBIFY_CASSETTE"
+CASSETTE_MODE_ENV_VAR = "SCRIBIFY_CASSETTE_MODE"
+CASSETTE_MISSES_ENV_VAR = "SCRIBIFY_CASSETTE_MISSES"
+# "replay" sleeps for each recorded latency; "instant" returns at once.
+CASSETTE_MODES = ["record", "replay", "instant"]
@@ -10,9 +10,21 @@ class APIError(WhisperCLIError):
     """OpenAI API related issues."""
 
 
+class ChunkTooLargeError(APIError):
+    """The API rejected or timed out on a chunk; smaller pieces may succeed."""
+
+
 class ChunkingError(WhisperCLIError):
     """Errors during chunking or cleanup."""
 
 
 class ConfigurationError(WhisperCLIError):
     """Invalid or missing configuration."""
+
+
+class BackendError(WhisperCLIError):
+    """Transcription backend unavailable or failed."""
+
+
+class CassetteError(WhisperCLIError):
+    """A recorded API cassette is unreadable or lacks a requested response."""
@@ -0,0 +1,88 @@
+import logging
+import os
+import time
+from typing import Optional
+
+from .constants import FOLLOW_IDLE_SECONDS, WATCH_POLL_SECONDS
+from .inotify import IN_CLOSE_WRITE, IN_MODIFY, Inotify
+
+logger = logging.getLogger(__name__)
+
+
+class GrowingFileReader:
+    """Read a file that is still being written, blocking until more data arrives.
+
+    ``read`` reports end of file only once the writer has closed the file
+    (seen through inotify on Linux) or the file has stopped growing for
+    ``idle_timeout`` seconds. It deliberately has no ``fileno`` so consumers
+    read through it instead of from the descriptor.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        idle_timeout: float = FOLLOW_IDLE_SECONDS,
+        poll_interval: float = WATCH_POLL_SECONDS,
+        use_inotify: bool = True,
+    ) -> None:
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.poll_interval = poll_interval
+        self._handle = open(path, "rb")
+        self._name = os.path.basename(path)
+        self._closed_at: Optional[float] = None
+        self._last_growth = time.monotonic()
+        self._inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify(
+                    os.path.dirname(os.path.abspath(path)), IN_MODIFY | IN_CLOSE_WRITE
+                )
+            except (OSError, AttributeError) as exc:
+                logger.info("inotify unavailable (%s); polling instead", exc)
+
+    def read(self, size: int = -1) -> bytes:
+        while True:
+            data = self._handle.read(size)
+            if data:
+                self._last_growth = time.monotonic()
+                return data
+            if self._writer_done():
+                # Anything written just before the close is readable now.
+                return self._handle.read(size)
+            self._wait()
+
+    def _writer_done(self) -> bool:
+        # Allow one poll interval after a close for writers that reopen to append.
+        if self._closed_at is not None and time.monotonic() - self._closed_at >= self.poll_interval:
+            return True
+        idle = time.monotonic() - self._last_growth
+        if idle >= self.idle_timeout:
+            logger.info("%s has not grown for %.0fs; finishing", self.path, idle)
+            return True
+        return False
+
+    def _wait(self) -> None:
+        if self._inotify is None:
+            time.sleep(self.poll_interval)
+            return
+        for name, mask in self._inotify.events(self.poll_interval):
+            if name != self._name:
+                continue
+            if mask & IN_CLOSE_WRITE:
+                self._closed_at = time.monotonic()
+            elif mask & IN_MODIFY:
+                # Written again after a close: keep following.
+                self._closed_at = None
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._handle.close()
+
+    def __enter__(self) -> "GrowingFileReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
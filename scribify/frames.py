@@ -0,0 +1,307 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Layer III bitrates in kbps by bitrate index.
+_MPEG1_BITRATES = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MPEG2_BITRATES = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+# Sample rates by the header's version bits (0: MPEG 2.5, 2: MPEG 2, 3: MPEG 1).
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    length: int
+    samples: int
+    sample_rate: int
+    bitrate: int
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.samples / self.sample_rate
+
+
+def parse_mp3_header(data, offset: int = 0) -> Optional[FrameHeader]:
+    """Decode the MPEG Layer III frame header at ``offset``, or ``None``."""
+    if offset + 4 > len(data):
+        return None
+    if data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return None
+    version = (data[offset + 1] >> 3) & 0x03
+    layer = (data[offset + 1] >> 1) & 0x03
+    if version == 1 or layer != 1:
+        return None
+    bitrate_index = data[offset + 2] >> 4
+    rate_index = (data[offset + 2] >> 2) & 0x03
+    padding = (data[offset + 2] >> 1) & 0x01
+    if bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = (_MPEG1_BITRATES if mpeg1 else _MPEG2_BITRATES)[bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    samples = 1152 if mpeg1 else 576
+    length = (samples // 8) * bitrate // sample_rate + padding
+    return FrameHeader(length=length, samples=samples, sample_rate=sample_rate, bitrate=bitrate)
+
+
+# Formats the chunker cuts without decoding. Raw .aac is not an upload format
+# the API accepts, so it still goes through MP3 export.
+SPLITTABLE_FORMATS = ("mp3",)
+# Largest Layer III frame: 320 kbps at 32 kHz, plus padding.
+MAX_MP3_FRAME_BYTES = 1441
+_CBR_PROBE_FRAMES = 64
+_CBR_PROBE_BYTES = 4096
+# Points across the file where the fast path checks the frame shape is unchanged.
+_CBR_SAMPLE_POINTS = 32
+_ID3V1_BYTES = 128
+
+
+@dataclass(frozen=True)
+class FrameRange:
+    """A run of whole frames: byte offsets ``[start, end)`` and its time span."""
+
+    start: int
+    end: int
+    start_seconds: float
+    end_seconds: float
+
+
+def _mp3_frame_table():
+    # (second header byte << 8 | third header byte) -> (frame length, seconds).
+    # The fourth byte never affects either, so two bytes identify a frame shape.
+    table = {}
+    for second in range(0xE0, 0x100):
+        for third in range(0x100):
+            header = parse_mp3_header(bytes((0xFF, second, third, 0)))
+            if header is not None:
+                table[(second << 8) | third] = (header.length, header.duration_seconds)
+    return table
+
+
+_MP3_FRAMES = _mp3_frame_table()
+
+
+def _mp3_frame(data, pos: int):
+    if pos + 4 > len(data) or data[pos] != 0xFF:
+        return None
+    return _MP3_FRAMES.get((data[pos + 1] << 8) | data[pos + 2])
+
+
+def _skip_id3(data) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _resync(data, pos: int) -> int:
+    """Find the next offset holding two chained frame headers, or ``len(data)``."""
+    size = len(data)
+    while True:
+        pos = data.find(b"\xff", pos + 1)
+        if pos < 0:
+            return size
+        entry = _mp3_frame(data, pos)
+        if entry is not None and (pos + entry[0] == size or _mp3_frame(data, pos + entry[0])):
+            return pos
+
+
+def _xing_offset(data, pos: int) -> int:
+    # The Xing/Info tag follows the header and the side information.
+    mpeg1 = (data[pos + 1] >> 3) & 0x03 == 3
+    mono = data[pos + 3] >> 6 == 3
+    return pos + 4 + ((17 if mono else 32) if mpeg1 else (9 if mono else 17))
+
+
+def _vbr_tag(data, pos: int) -> Optional[bytes]:
+    """Name of the Xing/Info/VBRI header frame at ``pos``, if it is one.
+
+    That frame describes the whole file's frame and byte counts, so it must not
+    travel with a chunk: decoders would report the full recording's duration.
+    """
+    if _mp3_frame(data, pos) is None:
+        return None
+    offset = _xing_offset(data, pos)
+    tag = bytes(data[offset : offset + 4])
+    if tag in (b"Xing", b"Info"):
+        return tag
+    if bytes(data[pos + 36 : pos + 40]) == b"VBRI":
+        return b"VBRI"
+    return None
+
+
+def _tag_frame_count(data, pos: int) -> Optional[int]:
+    """Frame count stored in the Xing/Info frame at ``pos``, when present."""
+    offset = _xing_offset(data, pos) + 4
+    if offset + 8 > len(data) or not data[offset + 3] & 0x01:
+        return None
+    return int.from_bytes(bytes(data[offset + 4 : offset + 8]), "big")
+
+
+def _mp3_shape(data, pos: int) -> Optional[int]:
+    # Header bits that stay fixed in a constant-bitrate stream (padding masked).
+    if _mp3_frame(data, pos) is None:
+        return None
+    return (data[pos + 1] << 8) | (data[pos + 2] & 0xFD)
+
+
+def _mp3_cbr_ranges(
+    data,
+    first: int,
+    max_bytes: int,
+    max_seconds: Optional[float],
+    expected_frames: Optional[int] = None,
+) -> Optional[List[FrameRange]]:
+    """Cut a constant-bitrate MP3 without walking every frame.
+
+    Padding only varies a frame's length by one byte, so frame counts follow
+    from byte counts, and each cut is placed by resynchronising just below
+    the size limit. A VBR file without a Xing header can start with a run of
+    identical frames, so the frame shape is also checked at points spread
+    over the whole file, every range's byte count must match its frame count
+    to within a byte, and the total must match ``expected_frames`` (from an
+    Info tag) when given. Returns ``None`` when any check fails, so the
+    caller can fall back to a full walk.
+    """
+    size = len(data)
+    if first + _CBR_PROBE_BYTES > size:
+        return None
+    shape = _mp3_shape(data, first)
+    pos = first
+    for _ in range(_CBR_PROBE_FRAMES):
+        if _mp3_shape(data, pos) != shape:
+            return None
+        pos += _mp3_frame(data, pos)[0]
+    audio_end = size
+    if bytes(data[size - _ID3V1_BYTES : size - _ID3V1_BYTES + 3]) == b"TAG":
+        audio_end -= _ID3V1_BYTES
+    for index in range(1, _CBR_SAMPLE_POINTS + 1):
+        point = pos + (audio_end - pos) * index // _CBR_SAMPLE_POINTS
+        if _last_chained_frame(data, first, point, shape, audio_end) is None:
+            return None
+
+    header = parse_mp3_header(data, first)
+    exact_length = (header.samples / 8) * header.bitrate / header.sample_rate
+    short_length = int(exact_length)
+    frame_seconds = header.duration_seconds
+    limit = max_bytes
+    if max_seconds:
+        # Any cut below this many bytes holds at most the allowed frame count.
+        limit = min(limit, (int(max_seconds / frame_seconds) + 1) * short_length - 1)
+
+    ranges: List[FrameRange] = []
+    range_start = first
+    counted_from = first
+    elapsed = 0.0
+    total_frames = 0
+    while size - range_start > limit:
+        cut = _last_chained_frame(data, counted_from, range_start + limit, shape)
+        if cut is None:
+            return None
+        frames = _frames_in(cut - counted_from, exact_length)
+        if frames is None:
+            return None
+        ranges.append(FrameRange(range_start, cut, elapsed, elapsed + frames * frame_seconds))
+        elapsed += frames * frame_seconds
+        total_frames += frames
+        range_start = counted_from = cut
+    frames = _frames_in(audio_end - counted_from, exact_length)
+    if frames is None:
+        return None
+    total_frames += frames
+    # Info counts may or may not include the tag frame itself.
+    if expected_frames is not None and abs(total_frames - expected_frames) > 1:
+        return None
+    ranges.append(FrameRange(range_start, size, elapsed, elapsed + frames * frame_seconds))
+    return ranges
+
+
+def _frames_in(length: int, exact_length: float) -> Optional[int]:
+    # Encoders pad so the running length stays within a byte of the exact one.
+    frames = round(length / exact_length)
+    if abs(length - frames * exact_length) > 1:
+        return None
+    return frames
+
+
+def _last_chained_frame(
+    data, lower: int, upper: int, shape: int, size: Optional[int] = None
+) -> Optional[int]:
+    """Latest offset in ``(lower, upper]`` starting three same-shaped frames.
+
+    A chain may end at ``size`` (the end of the audio) instead of a third frame.
+    """
+    size = len(data) if size is None else size
+    pos = upper + 1
+    floor = max(lower, upper - 2 * MAX_MP3_FRAME_BYTES)
+    while True:
+        pos = data.rfind(b"\xff", floor + 1, pos)
+        if pos < 0:
+            return None
+        probe = pos
+        for _ in range(3):
+            if probe == size:
+                break
+            if _mp3_shape(data, probe) != shape:
+                probe = -1
+                break
+            probe += _mp3_frame(data, probe)[0]
+        if probe >= 0:
+            return pos
+
+
+def frame_ranges(data, max_bytes: int, max_seconds: Optional[float] = None) -> List[FrameRange]:
+    """Group the frames of an MP3 buffer into uploadable ranges.
+
+    ``data`` is any buffer (typically an ``mmap``). Frame headers are walked
+    without decoding; each range ends on a frame boundary and stays within
+    ``max_bytes`` and ``max_seconds``. Leading ID3 tags and a Xing/Info/VBRI
+    header frame are left out of the ranges; junk between frames and trailing
+    tags travel with the neighbouring range. Returns an empty list when no
+    frames are found.
+    """
+    size = len(data)
+    pos = _skip_id3(data)
+    if _mp3_frame(data, pos) is None:
+        pos = _resync(data, pos)
+        if pos >= size:
+            return []
+    tag = _vbr_tag(data, pos)
+    count = None
+    if tag is not None:
+        count = _tag_frame_count(data, pos)
+        pos += _mp3_frame(data, pos)[0]
+        if pos >= size:
+            return []
+    # Xing/VBRI mark variable bitrate; Info is LAME's tag for CBR files.
+    if tag not in (b"Xing", b"VBRI"):
+        ranges = _mp3_cbr_ranges(data, pos, max_bytes, max_seconds, count)
+        if ranges is not None:
+            return ranges
+
+    ranges: List[FrameRange] = []
+    range_start = pos
+    range_start_seconds = 0.0
+    elapsed = 0.0
+    limit_seconds = max_seconds or float("inf")
+    while pos < size:
+        entry = _mp3_frame(data, pos)
+        if entry is None:
+            pos = _resync(data, pos)
+            continue
+        length, seconds = entry
+        over_size = pos + length - range_start > max_bytes
+        over_time = elapsed + seconds - range_start_seconds > limit_seconds
+        if (over_size or over_time) and pos > range_start:
+            ranges.append(FrameRange(range_start, pos, range_start_seconds, elapsed))
+            range_start = pos
+            range_start_seconds = elapsed
+        pos += length
+        elapsed += seconds
+    ranges.append(FrameRange(range_start, size, range_start_seconds, elapsed))
+    return ranges
@@ -0,0 +1,119 @@
+import gzip
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+# Preferred first when a client accepts several encodings equally.
+ENCODINGS = ("br", "gzip")
+# Bodies smaller than this are not worth compressing.
+MIN_COMPRESS_BYTES = 256
+
+
+def _brotli_compress(data: bytes) -> Optional[bytes]:
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+@dataclass(frozen=True)
+class Representations:
+    """One resource body plus its precompressed variants, keyed by encoding."""
+
+    identity: bytes
+    etag: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def variant_etag(self, encoding: Optional[str]) -> str:
+        # Each encoding is a distinct representation and needs its own strong tag.
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+    def etags(self) -> Tuple[str, ...]:
+        return (self.etag, *(self.variant_etag(encoding) for encoding in self.encoded))
+
+
+def precompress(data: bytes) -> Representations:
+    """Hash ``data`` and compress it once with every available encoding."""
+    etag = f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+    encoded: Dict[str, bytes] = {}
+    if len(data) >= MIN_COMPRESS_BYTES:
+        compressed = _brotli_compress(data)
+        if compressed is not None and len(compressed) < len(data):
+            encoded["br"] = compressed
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) < len(data):
+            encoded["gzip"] = compressed
+    return Representations(identity=data, etag=etag, encoded=encoded)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Pick the best of ``available`` for an ``Accept-Encoding`` header.
+
+    Returns ``None`` for the identity encoding.
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = weight
+    available = set(available)
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        if encoding not in available:
+            continue
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def etag_matches(if_none_match: Optional[str], etags: Iterable[str]) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etags``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(etag in candidates for etag in etags)
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Resolve a single ``bytes=`` range to inclusive ``(first, last)`` offsets.
+
+    Returns ``None`` when the header is absent, malformed or asks for several
+    ranges, in which case the whole body is served. Raises ``ValueError`` when
+    the range cannot be satisfied.
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes=") :].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    first_text, _, last_text = spec.partition("-")
+    if not first_text:
+        if not last_text.isdigit():
+            return None
+        suffix = int(last_text)
+        if suffix == 0 or size == 0:
+            raise ValueError("range cannot be satisfied")
+        return max(size - suffix, 0), size - 1
+    if not first_text.isdigit() or (last_text and not last_text.isdigit()):
+        return None
+    first = int(first_text)
+    last = int(last_text) if last_text else size - 1
+    if last_text and first > last:
+        return None
+    if first >= size:
+        raise ValueError("range cannot be satisfied")
+    return first, min(last, size - 1)
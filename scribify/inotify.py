@@ -0,0 +1,48 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+from typing import Iterator, Tuple
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """Minimal ctypes binding reporting ``mask`` events for files in ``directory``."""
+
+    def __init__(self, directory: str, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(_IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, "inotify_add_watch failed")
+
+    def events(self, timeout: float) -> Iterator[Tuple[str, int]]:
+        """Yield ``(file name, event mask)`` pairs, waiting up to ``timeout`` seconds."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                yield os.fsdecode(name), mask
+
+    def read(self, timeout: float) -> Iterator[str]:
+        for name, _ in self.events(timeout):
+            yield name
+
+    def close(self) -> None:
+        os.close(self.fd)
@@ -0,0 +1,51 @@
+import math
+from typing import List, Optional, Tuple
+
+from .constants import (
+    CHUNK_EXPORT_BITRATE_KBPS,
+    CHUNK_SIZE_MB,
+    CHUNK_SIZE_SAFETY_RATIO,
+    MODEL_MAX_DURATION_SECONDS,
+)
+from .exceptions import ChunkingError
+
+Span = Tuple[int, int]
+
+
+def model_max_duration_seconds(model: Optional[str]) -> Optional[float]:
+    if not model:
+        return None
+    return MODEL_MAX_DURATION_SECONDS.get(model)
+
+
+def max_chunk_seconds(
+    chunk_size_mb: float,
+    bitrate_kbps: int = CHUNK_EXPORT_BITRATE_KBPS,
+    max_duration_seconds: Optional[float] = None,
+) -> float:
+    if chunk_size_mb <= 0 or bitrate_kbps <= 0:
+        raise ChunkingError("Chunk size and bitrate must be positive.")
+    budget_bits = chunk_size_mb * 1024 * 1024 * 8 * CHUNK_SIZE_SAFETY_RATIO
+    seconds = budget_bits / (bitrate_kbps * 1000)
+    if max_duration_seconds:
+        seconds = min(seconds, max_duration_seconds)
+    return seconds
+
+
+def plan_chunks(
+    duration_ms: int,
+    chunk_size_mb: float = CHUNK_SIZE_MB,
+    bitrate_kbps: int = CHUNK_EXPORT_BITRATE_KBPS,
+    max_duration_seconds: Optional[float] = None,
+) -> List[Span]:
+    """Split ``duration_ms`` into the fewest equal spans that fit the limits.
+
+    Each span's encoded size at ``bitrate_kbps`` stays under ``chunk_size_mb``
+    and its length under ``max_duration_seconds`` when given.
+    """
+    if duration_ms <= 0:
+        return []
+    limit_ms = int(max_chunk_seconds(chunk_size_mb, bitrate_kbps, max_duration_seconds) * 1000)
+    num_chunks = max(1, math.ceil(duration_ms / float(limit_ms)))
+    bounds = [duration_ms * idx // num_chunks for idx in range(num_chunks + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
@@ -1,6 +1,7 @@
-from typing import Iterable, Optional, TypeVar
+from typing import TYPE_CHECKING, Iterable, Optional, TypeVar
 
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 T = TypeVar("T")
 
@@ -8,10 +9,18 @@ T = TypeVar("T")
 class ProgressReporter:
     def __init__(self, quiet: bool = False) -> None:
         self.quiet = quiet
-        self._progress: Optional[Progress] = None
+        self._progress: Optional["Progress"] = None
 
     def __enter__(self) -> "ProgressReporter":
         if not self.quiet:
+            from rich.progress import (
+                BarColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+                TimeElapsedColumn,
+            )
+
             self._progress = Progress(
                 SpinnerColumn(),
                 TextColumn("{task.description}"),
@@ -26,7 +35,7 @@ class ProgressReporter:
         if self._progress:
             self._progress.stop()
 
-    def add_task(self, description: str, total: int) -> Optional[int]:
+    def add_task(self, description: str, total: Optional[int]) -> Optional[int]:
         if not self._progress:
             return None
         return self._progress.add_task(description, total=total)
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class ChunkResult:
+    index: int
+    text: str
+    seconds: float
+    retries: int = 0
+    bytes_uploaded: int = 0
+    # Times the chunk was halved after the API rejected it.
+    splits: int = 0
+    # Position in the original recording, when the audio was chunked.
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+
+
+@dataclass
+class TranscriptionResult:
+    text: str
+    chunks: List[ChunkResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def retries(self) -> int:
+        return sum(chunk.retries for chunk in self.chunks)
+
+    @property
+    def bytes_uploaded(self) -> int:
+        return sum(chunk.bytes_uploaded for chunk in self.chunks)
@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .constants import SEARCH_DEFAULT_LIMIT
+from .exceptions import ConfigurationError
+from .result import TranscriptionResult
+
+# (text, start_ms, end_ms) of one indexed piece of a transcript.
+Segment = Tuple[str, Optional[int], Optional[int]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    indexed_at REAL NOT NULL,
+    source_mtime REAL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    start_ms INTEGER,
+    end_ms INTEGER
+);
+CREATE INDEX IF NOT EXISTS segments_job ON segments (job_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5 (
+    text, tokenize = 'unicode61', prefix = '2 3'
+);
+"""
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    job_id: str
+    snippet: str
+    score: float
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+
+
+def _segments(transcript: Union[str, TranscriptionResult]) -> List[Segment]:
+    if isinstance(transcript, str):
+        return [(transcript, None, None)]
+    if len(transcript.chunks) > 1:
+        return [(chunk.text, chunk.start_ms, chunk.end_ms) for chunk in transcript.chunks]
+    return [(transcript.text, None, None)]
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every term.
+
+    Terms are quoted so punctuation can't be read as query syntax; a trailing
+    ``*`` keeps its prefix-match meaning.
+    """
+    terms = []
+    for term in text.split():
+        prefix = term.endswith("*")
+        term = term.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class TranscriptIndex:
+    """Incremental SQLite FTS5 index of finished transcripts.
+
+    Each transcript is stored per chunk so hits can point at a position in
+    the recording. Re-adding a job replaces its previous entry. The index is
+    safe to share between threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        try:
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.executescript(_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            self._db.close()
+            raise ConfigurationError(f"SQLite FTS5 is unavailable: {exc}") from exc
+
+    def add(
+        self,
+        job_id: str,
+        transcript: Union[str, TranscriptionResult],
+        source_mtime: Optional[float] = None,
+    ) -> None:
+        segments = _segments(transcript)
+        with self._lock, self._db:
+            self._delete(job_id)
+            for text, start_ms, end_ms in segments:
+                row_id = self._db.execute(
+                    "INSERT INTO segments_fts (text) VALUES (?)", (text,)
+                ).lastrowid
+                self._db.execute(
+                    "INSERT INTO segments (id, job_id, start_ms, end_ms) VALUES (?, ?, ?, ?)",
+                    (row_id, job_id, start_ms, end_ms),
+                )
+            self._db.execute(
+                "INSERT INTO jobs (job_id, indexed_at, source_mtime) VALUES (?, ?, ?)",
+                (job_id, time.time(), source_mtime),
+            )
+
+    def remove(self, job_id: str) -> None:
+        with self._lock, self._db:
+            self._delete(job_id)
+
+    def _delete(self, job_id: str) -> None:
+        self._db.execute(
+            "DELETE FROM segments_fts WHERE rowid IN (SELECT id FROM segments WHERE job_id = ?)",
+            (job_id,),
+        )
+        self._db.execute("DELETE FROM segments WHERE job_id = ?", (job_id,))
+        self._db.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def sync_directory(self, directory: str) -> int:
+        """Index ``{job_id}.txt`` files that are new or changed since last time.
+
+        Returns the number of transcripts (re)indexed.
+        """
+        with self._lock:
+            known = dict(self._db.execute("SELECT job_id, source_mtime FROM jobs"))
+        indexed = 0
+        for entry in os.scandir(directory):
+            job_id, ext = os.path.splitext(entry.name)
+            if ext != ".txt" or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if job_id in known and known[job_id] == mtime:
+                continue
+            with open(entry.path, "r", encoding="utf-8") as handle:
+                self.add(job_id, handle.read(), source_mtime=mtime)
+            indexed += 1
+        return indexed
+
+    def search(self, query: str, limit: int = SEARCH_DEFAULT_LIMIT) -> List[SearchHit]:
+        """Return up to ``limit`` jobs matching ``query``, best first.
+
+        Each job is reported once, with the snippet and position of its
+        best-matching chunk.
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        # Several chunks of one job may rank highly; over-fetch, then keep the best per job.
+        with self._lock:
+            rows = self._db.execute(
+                """
+                SELECT s.job_id, s.start_ms, s.end_ms, hits.snippet, hits.rank
+                FROM (
+                    SELECT rowid, snippet(segments_fts, 0, '[', ']', '...', 16) AS snippet, rank
+                    FROM segments_fts WHERE segments_fts MATCH ? ORDER BY rank LIMIT ?
+                ) AS hits
+                JOIN segments AS s ON s.id = hits.rowid
+                ORDER BY hits.rank
+                """,
+                (match, limit * 4),
+            ).fetchall()
+        return _best_per_job(rows, limit)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _best_per_job(rows: Iterable[Sequence], limit: int) -> List[SearchHit]:
+    hits: List[SearchHit] = []
+    seen = set()
+    for job_id, start_ms, end_ms, snippet, rank in rows:
+        if job_id in seen:
+            continue
+        seen.add(job_id)
+        # FTS5's bm25 rank is negative; flip it so higher means better.
+        hits.append(SearchHit(job_id, snippet, -rank, start_ms, end_ms))
+        if len(hits) == limit:
+            break
+    return hits
@@ -0,0 +1,142 @@
+import shutil
+import subprocess
+import threading
+from collections import deque
+from typing import BinaryIO, Deque, Iterator, Optional, Sequence, Tuple
+
+from .constants import (
+    CHUNK_EXPORT_BITRATE_KBPS,
+    CHUNK_SIZE_MB,
+    STREAM_READ_BYTES,
+    STREAM_STDERR_TAIL_LINES,
+)
+from .exceptions import AudioFileError, ChunkingError
+from .frames import parse_mp3_header
+from .planner import max_chunk_seconds
+
+# Encoded chunk bytes with its (start_ms, end_ms) in the stream.
+StreamChunk = Tuple[bytes, int, int]
+
+
+class StreamingChunker:
+    """Cut an audio stream into uploadable MP3 chunks while it is still arriving.
+
+    ffmpeg decodes whatever container arrives on the stream and re-encodes it
+    to constant-bitrate MP3. The output is split on frame boundaries as soon
+    as a chunk's worth has accumulated. Only the chunk being filled is held in
+    memory.
+    """
+
+    def __init__(
+        self,
+        chunk_size_mb: int = CHUNK_SIZE_MB,
+        bitrate_kbps: int = CHUNK_EXPORT_BITRATE_KBPS,
+        max_duration_seconds: Optional[float] = None,
+        input_options: Sequence[str] = (),
+    ) -> None:
+        self.bitrate_kbps = bitrate_kbps
+        # Extra ffmpeg demuxer options placed before the input.
+        self.input_options = list(input_options)
+        seconds = max_chunk_seconds(chunk_size_mb, bitrate_kbps, max_duration_seconds)
+        self.chunk_bytes = int(seconds * bitrate_kbps * 1000 / 8)
+
+    def _spawn(self, stream: BinaryIO) -> subprocess.Popen:
+        ffmpeg = shutil.which("ffmpeg")
+        if not ffmpeg:
+            raise AudioFileError("FFmpeg not found. Install with: apt-get install ffmpeg")
+        try:
+            stdin = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            stdin = subprocess.PIPE
+        command = [
+            ffmpeg,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            *self.input_options,
+            "-i",
+            "pipe:0",
+            "-vn",
+            "-f",
+            "mp3",
+            "-b:a",
+            f"{self.bitrate_kbps}k",
+            # No ID3 tag or Xing frame: the output must be bare, splittable frames.
+            "-id3v2_version",
+            "0",
+            "-write_xing",
+            "0",
+            "pipe:1",
+        ]
+        proc = subprocess.Popen(
+            command, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        if stdin == subprocess.PIPE:
+            threading.Thread(target=self._feed, args=(stream, proc.stdin), daemon=True).start()
+        return proc
+
+    @staticmethod
+    def _feed(stream: BinaryIO, sink: BinaryIO) -> None:
+        try:
+            for block in iter(lambda: stream.read(STREAM_READ_BYTES), b""):
+                sink.write(block)
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            try:
+                sink.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _drain(source: BinaryIO, tail: Deque[bytes]) -> None:
+        # ffmpeg blocks once an unread stderr pipe fills, so it is read throughout.
+        try:
+            for line in source:
+                tail.append(line)
+        except (OSError, ValueError):
+            pass
+
+    def iter_chunks(self, stream: BinaryIO) -> Iterator[StreamChunk]:
+        proc = self._spawn(stream)
+        stderr_tail: Deque[bytes] = deque(maxlen=STREAM_STDERR_TAIL_LINES)
+        drain = threading.Thread(target=self._drain, args=(proc.stderr, stderr_tail), daemon=True)
+        drain.start()
+        buffer = bytearray()
+        cursor = 0
+        chunk_start = 0.0
+        position = 0.0
+        try:
+            for block in iter(lambda: proc.stdout.read(STREAM_READ_BYTES), b""):
+                buffer += block
+                while True:
+                    header = parse_mp3_header(buffer, cursor)
+                    if header is None:
+                        if cursor + 4 > len(buffer):
+                            break
+                        cursor += 1  # not a frame start; resynchronise
+                        continue
+                    if cursor + header.length > len(buffer):
+                        break
+                    if cursor and cursor + header.length > self.chunk_bytes:
+                        yield bytes(buffer[:cursor]), int(chunk_start * 1000), int(position * 1000)
+                        del buffer[:cursor]
+                        cursor = 0
+                        chunk_start = position
+                    cursor += header.length
+                    position += header.duration_seconds
+
+            returncode = proc.wait()
+            if returncode != 0:
+                drain.join()
+                message = b"".join(stderr_tail).decode(errors="replace").strip()
+                raise ChunkingError(f"Failed to decode audio stream: {message or returncode}")
+            if buffer:
+                yield bytes(buffer), int(chunk_start * 1000), int(position * 1000)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            drain.join()
+            proc.stdout.close()
+            proc.stderr.close()
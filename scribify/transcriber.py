@@ -1,50 +1,425 @@
-from typing import List, Optional
+import asyncio
+import contextlib
+import inspect
+import io
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
 
-from .api_client import OpenAITranscriptionClient
-from .audio_utils import get_file_size_mb, validate_audio_file
-from .chunker import AudioChunker
-from .constants import MAX_FILE_SIZE_MB
-from .exceptions import WhisperCLIError
+from .audio_utils import (
+    get_audio_format,
+    get_duration_seconds,
+    get_file_size_mb,
+    validate_audio_file,
+    validate_audio_format,
+)
+from .constants import (
+    DEFAULT_CONCURRENCY,
+    FOLLOW_CHUNK_SECONDS,
+    FOLLOW_IDLE_SECONDS,
+    MAX_FILE_SIZE_MB,
+    MAX_RESPLIT_DEPTH,
+)
+from .exceptions import ChunkTooLargeError, WhisperCLIError
 from .merger import merge_transcriptions
+from .planner import model_max_duration_seconds
 from .progress import ProgressReporter
+from .result import ChunkResult, TranscriptionResult
+
+if TYPE_CHECKING:
+    from .backends import TranscriptionBackend
+    from .chunker import AudioChunker
+    from .streaming import StreamChunk
+
+logger = logging.getLogger(__name__)
+
+# A path on disk, the encoded audio itself, or a binary file object.
+AudioSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO]
+
+
+@dataclass
+class _Upload:
+    index: int
+    source: Union[str, bytes]
+    filename: str
+    size_bytes: int
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+
+
+@dataclass
+class _Prepared:
+    uploads: List[_Upload]
+    chunker: Optional["AudioChunker"] = None
+    chunk_paths: Optional[List[str]] = None
+    # Sub-chunks created while re-splitting rejected chunks.
+    split_paths: List[str] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 class Transcriber:
     def __init__(
         self,
-        client: OpenAITranscriptionClient,
-        chunker: Optional[AudioChunker] = None,
+        client: "TranscriptionBackend",
+        chunker: Optional["AudioChunker"] = None,
         quiet: bool = False,
+        strip_silence: bool = False,
     ) -> None:
         self.client = client
-        self.chunker = chunker or AudioChunker()
+        self.chunker = chunker
         self.quiet = quiet
+        self.strip_silence = strip_silence
+
+    def _chunker_for_run(self) -> "AudioChunker":
+        if self.chunker is not None:
+            return self.chunker
+        # pydub is only needed once a file has to be split. A fresh chunker per
+        # run keeps concurrent transcriptions from sharing temp state.
+        from .chunker import AudioChunker
+
+        return AudioChunker(
+            max_duration_seconds=self._max_duration_seconds(),
+            strip_silence=self.strip_silence,
+        )
+
+    def _max_duration_seconds(self) -> Optional[float]:
+        return model_max_duration_seconds(getattr(self.client, "model", None))
+
+    def _exceeds_duration_limit(self, audio_file: str) -> bool:
+        limit = self._max_duration_seconds()
+        if limit is None:
+            return False
+        duration = get_duration_seconds(audio_file)
+        return duration is not None and duration > limit
 
     def transcribe(self, audio_file: str) -> str:
-        validate_audio_file(audio_file)
-        size_mb = get_file_size_mb(audio_file)
+        return self.transcribe_result(audio_file).text
+
+    def transcribe_result(
+        self, source: AudioSource, filename: Optional[str] = None
+    ) -> TranscriptionResult:
+        started = time.perf_counter()
+        prepared = _Prepared(uploads=[])
+        try:
+            prepared = self._prepare(source, filename)
+            chunks: List[ChunkResult] = []
+            with ProgressReporter(quiet=self._progress_quiet(prepared)) as progress:
+                task_id = progress.add_task("Transcribing chunks", total=len(prepared.uploads))
+                for upload in prepared.uploads:
+                    chunks.append(self._transcribe_upload(prepared, upload))
+                    progress.advance(task_id)
+            return self._finish(prepared, chunks, started)
+        except WhisperCLIError:
+            raise
+        except Exception as exc:
+            raise WhisperCLIError("Unexpected transcription error.") from exc
+        finally:
+            self._cleanup(prepared)
+
+    def transcribe_stream(
+        self, stream: BinaryIO, on_chunk: Optional[Callable[[ChunkResult], None]] = None
+    ) -> TranscriptionResult:
+        """Transcribe audio from a pipe, uploading each chunk as soon as it is cut.
+
+        One chunk uploads while the next is read, so memory stays around two
+        chunks whatever the stream length. ``on_chunk`` is called with each
+        chunk's result, in order, as soon as it is available.
+        """
+        from .streaming import StreamingChunker
+
+        streamer = StreamingChunker(max_duration_seconds=self._max_duration_seconds())
+        return self._transcribe_pieces(streamer.iter_chunks(stream), on_chunk)
+
+    def transcribe_follow(
+        self,
+        path: str,
+        on_chunk: Optional[Callable[[ChunkResult], None]] = None,
+        chunk_seconds: float = FOLLOW_CHUNK_SECONDS,
+        idle_timeout: float = FOLLOW_IDLE_SECONDS,
+    ) -> TranscriptionResult:
+        """Transcribe a file that is still being recorded, chunk by chunk.
+
+        Chunks of at most ``chunk_seconds`` are cut and uploaded as the file
+        grows; transcription finishes once the writer closes the file or it
+        stops growing for ``idle_timeout`` seconds.
+        """
+        from .follow import GrowingFileReader
+        from .streaming import StreamingChunker
+
+        validate_audio_format(path)
+        limit = self._max_duration_seconds()
+        # A WAV header written before recording ends carries a bogus data size.
+        input_options = ("-ignore_length", "1") if get_audio_format(path) == "wav" else ()
+        streamer = StreamingChunker(
+            max_duration_seconds=min(chunk_seconds, limit) if limit else chunk_seconds,
+            input_options=input_options,
+        )
+        with GrowingFileReader(path, idle_timeout=idle_timeout) as reader:
+            return self._transcribe_pieces(streamer.iter_chunks(reader), on_chunk)
+
+    def _transcribe_pieces(
+        self,
+        pieces: Iterator["StreamChunk"],
+        on_chunk: Optional[Callable[[ChunkResult], None]],
+    ) -> TranscriptionResult:
+        started = time.perf_counter()
+        prepared = _Prepared(uploads=[], chunk_paths=[])
+        chunks: List[ChunkResult] = []
+        pending: Optional[Future] = None
+        progress = ProgressReporter(quiet=self.quiet)
 
-        if size_mb <= MAX_FILE_SIZE_MB:
-            return self.client.transcribe_file(audio_file)
+        def collect(future: Future) -> None:
+            chunks.append(future.result())
+            progress.advance(task_id)
+            if on_chunk is not None:
+                on_chunk(chunks[-1])
 
-        chunk_paths: List[str] = []
         try:
-            chunk_paths = self.chunker.chunk_audio(audio_file)
-            with ProgressReporter(quiet=self.quiet) as progress:
-                task_id = progress.add_task("Transcribing chunks", total=len(chunk_paths))
-                results: List[str] = []
-                for chunk_path in chunk_paths:
-                    results.append(self.client.transcribe_file(chunk_path))
+            with ThreadPoolExecutor(max_workers=1) as pool, progress, contextlib.closing(pieces):
+                task_id = progress.add_task("Transcribing stream", total=None)
+                for idx, (data, start_ms, end_ms) in enumerate(pieces):
+                    upload = _Upload(
+                        index=idx,
+                        source=data,
+                        filename=f"chunk_{idx + 1:03d}.mp3",
+                        size_bytes=len(data),
+                        start_ms=start_ms,
+                        end_ms=end_ms,
+                    )
+                    if pending is not None:
+                        collect(pending)
+                    pending = pool.submit(self._transcribe_upload, prepared, upload)
+                if pending is not None:
+                    collect(pending)
+            return self._finish(prepared, chunks, started)
+        except WhisperCLIError:
+            raise
+        except Exception as exc:
+            raise WhisperCLIError("Unexpected transcription error.") from exc
+        finally:
+            self._cleanup(prepared)
+
+    async def transcribe_async(
+        self,
+        source: AudioSource,
+        filename: Optional[str] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> TranscriptionResult:
+        """Transcribe on the running event loop, uploading chunks concurrently.
+
+        Pass a shared ``semaphore`` to bound uploads across several calls.
+        Decoding and chunking run in a worker thread since they are CPU-bound,
+        and take a slot of the same semaphore so a batch does not decode
+        every source at once.
+        """
+        started = time.perf_counter()
+        semaphore = semaphore or asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        if not isinstance(source, (str, os.PathLike)):
+            filename = filename or getattr(source, "name", None)
+        prepared = _Prepared(uploads=[])
+        try:
+            # Reading a file object or a path blocks, so all of preparation runs off the loop.
+            async with semaphore:
+                prepared = await asyncio.to_thread(self._prepare, source, filename)
+            with ProgressReporter(quiet=self._progress_quiet(prepared)) as progress:
+                task_id = progress.add_task("Transcribing chunks", total=len(prepared.uploads))
+
+                async def run(upload: _Upload) -> ChunkResult:
+                    async with semaphore:
+                        chunk = await self._transcribe_upload_async(prepared, upload)
                     progress.advance(task_id)
-            return merge_transcriptions(results)
+                    return chunk
+
+                chunks = await asyncio.gather(*(run(upload) for upload in prepared.uploads))
+            return self._finish(prepared, list(chunks), started)
         except WhisperCLIError:
             raise
         except Exception as exc:
             raise WhisperCLIError("Unexpected transcription error.") from exc
         finally:
-            if chunk_paths:
-                try:
-                    self.chunker.cleanup_chunks(chunk_paths)
-                except Exception:
-                    if not self.quiet:
-                        print("Warning: failed to clean up temp chunks")
+            await asyncio.to_thread(self._cleanup, prepared)
+
+    def _progress_quiet(self, prepared: _Prepared) -> bool:
+        return self.quiet or prepared.chunk_paths is None
+
+    @staticmethod
+    def _read_source(source: AudioSource) -> bytes:
+        if isinstance(source, bytes):
+            return source
+        if isinstance(source, (bytearray, memoryview)):
+            return bytes(source)
+        return source.read()
+
+    def _prepare(self, source: AudioSource, filename: Optional[str]) -> _Prepared:
+        if isinstance(source, (str, os.PathLike)):
+            audio_file = os.fspath(source)
+            validate_audio_file(audio_file)
+            size_mb = get_file_size_mb(audio_file)
+
+            # Silence stripping re-encodes, so even small files go through the chunker.
+            if (
+                not self.strip_silence
+                and size_mb <= MAX_FILE_SIZE_MB
+                and not self._exceeds_duration_limit(audio_file)
+            ):
+                upload = _Upload(
+                    index=0,
+                    source=audio_file,
+                    filename=os.path.basename(audio_file),
+                    size_bytes=int(size_mb * 1024 * 1024),
+                )
+                return _Prepared(uploads=[upload])
+            chunker = self._chunker_for_run()
+            chunk_paths = chunker.chunk_audio(audio_file)
+        else:
+            data = self._read_source(source)
+            filename = filename or getattr(source, "name", None) or "audio.mp3"
+            validate_audio_format(filename)
+            if not self.strip_silence and len(data) <= MAX_FILE_SIZE_MB * 1024 * 1024:
+                upload = _Upload(
+                    index=0,
+                    source=data,
+                    filename=os.path.basename(filename),
+                    size_bytes=len(data),
+                )
+                return _Prepared(uploads=[upload])
+            chunker = self._chunker_for_run()
+            chunk_paths = chunker.chunk_audio(io.BytesIO(data), get_audio_format(filename) or None)
+
+        spans: List[Tuple[int, int]] = getattr(chunker, "spans", None) or []
+        uploads = []
+        for idx, chunk_path in enumerate(chunk_paths):
+            start_ms, end_ms = spans[idx] if idx < len(spans) else (None, None)
+            uploads.append(
+                _Upload(
+                    index=idx,
+                    source=chunk_path,
+                    filename=os.path.basename(chunk_path),
+                    size_bytes=os.path.getsize(chunk_path) if os.path.exists(chunk_path) else 0,
+                    start_ms=start_ms,
+                    end_ms=end_ms,
+                )
+            )
+        return _Prepared(uploads=uploads, chunker=chunker, chunk_paths=chunk_paths)
+
+    def _call_client(self, upload: _Upload):
+        transcribe_with_retries = getattr(self.client, "transcribe_with_retries", None)
+        if transcribe_with_retries is not None:
+            return transcribe_with_retries(upload.source, filename=upload.filename)
+        return self.client.transcribe_file(upload.source)
+
+    def _transcribe_upload(
+        self, prepared: _Prepared, upload: _Upload, depth: int = 0
+    ) -> ChunkResult:
+        started = time.perf_counter()
+        try:
+            return self._chunk_result(upload, self._call_client(upload), started)
+        except ChunkTooLargeError:
+            if depth >= MAX_RESPLIT_DEPTH:
+                raise
+        halves = self._split_upload(prepared, upload)
+        with ThreadPoolExecutor(max_workers=len(halves)) as pool:
+            parts = list(
+                pool.map(lambda half: self._transcribe_upload(prepared, half, depth + 1), halves)
+            )
+        return self._splice(upload, parts, started)
+
+    async def _transcribe_upload_async(
+        self, prepared: _Prepared, upload: _Upload, depth: int = 0
+    ) -> ChunkResult:
+        started = time.perf_counter()
+        call = getattr(self.client, "transcribe_with_retries", None) or self.client.transcribe_file
+        try:
+            if inspect.iscoroutinefunction(call):
+                outcome = await self._call_client(upload)
+            else:
+                # Blocking clients still work, at the cost of a thread per upload.
+                outcome = await asyncio.to_thread(self._call_client, upload)
+            return self._chunk_result(upload, outcome, started)
+        except ChunkTooLargeError:
+            if depth >= MAX_RESPLIT_DEPTH:
+                raise
+        halves = await asyncio.to_thread(self._split_upload, prepared, upload)
+        parts = await asyncio.gather(
+            *(self._transcribe_upload_async(prepared, half, depth + 1) for half in halves)
+        )
+        return self._splice(upload, list(parts), started)
+
+    def _split_upload(self, prepared: _Prepared, upload: _Upload) -> List[_Upload]:
+        with prepared.lock:
+            if prepared.chunker is None:
+                prepared.chunker = self._chunker_for_run()
+        chunker = prepared.chunker
+        pieces = chunker.bisect_chunk(upload.source, get_audio_format(upload.filename) or None)
+        halves = []
+        for path, start_ms, end_ms in pieces:
+            with prepared.lock:
+                prepared.split_paths.append(path)
+            offset = upload.start_ms
+            halves.append(
+                _Upload(
+                    index=upload.index,
+                    source=path,
+                    filename=os.path.basename(path),
+                    size_bytes=os.path.getsize(path),
+                    start_ms=None if offset is None else offset + start_ms,
+                    end_ms=None if offset is None else offset + end_ms,
+                )
+            )
+        logger.info("Re-split rejected chunk %d into %d parts", upload.index + 1, len(halves))
+        return halves
+
+    @staticmethod
+    def _splice(upload: _Upload, parts: List[ChunkResult], started: float) -> ChunkResult:
+        return ChunkResult(
+            index=upload.index,
+            text=merge_transcriptions(part.text for part in parts),
+            seconds=time.perf_counter() - started,
+            retries=sum(part.retries for part in parts),
+            # The rejected upload was sent once before being split.
+            bytes_uploaded=upload.size_bytes + sum(part.bytes_uploaded for part in parts),
+            splits=1 + sum(part.splits for part in parts),
+            start_ms=upload.start_ms,
+            end_ms=upload.end_ms,
+        )
+
+    @staticmethod
+    def _chunk_result(upload: _Upload, outcome, started: float) -> ChunkResult:
+        text, retries = outcome if isinstance(outcome, tuple) else (outcome, 0)
+        return ChunkResult(
+            index=upload.index,
+            text=text,
+            seconds=time.perf_counter() - started,
+            retries=retries,
+            bytes_uploaded=upload.size_bytes * (retries + 1),
+            start_ms=upload.start_ms,
+            end_ms=upload.end_ms,
+        )
+
+    @staticmethod
+    def _finish(
+        prepared: _Prepared, chunks: List[ChunkResult], started: float
+    ) -> TranscriptionResult:
+        if prepared.chunk_paths is None:
+            text = chunks[0].text
+        else:
+            text = merge_transcriptions(chunk.text for chunk in chunks)
+        return TranscriptionResult(
+            text=text,
+            chunks=chunks,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    @staticmethod
+    def _cleanup(prepared: _Prepared) -> None:
+        paths = (prepared.chunk_paths or []) + prepared.split_paths
+        if not paths:
+            return
+        try:
+            prepared.chunker.cleanup_chunks(paths)
+        except Exception:
+            logger.warning("Failed to clean up temp chunks")
@@ -0,0 +1,142 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from pydub import AudioSegment
+
+from .constants import (
+    VAD_FRAME_MS,
+    VAD_MIN_SILENCE_MS,
+    VAD_MIN_THRESHOLD_DBFS,
+    VAD_NOISE_MARGIN_DB,
+    VAD_PADDING_MS,
+    VAD_SPEECH_RANGE_DB,
+)
+from .exceptions import ConfigurationError
+
+Span = Tuple[int, int]
+# Frames converted to float at a time when measuring energy (about two minutes
+# of audio at 30 ms frames), so the whole recording is never copied as floats.
+_RMS_BLOCK_FRAMES = 4096
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ConfigurationError(
+            "Silence stripping requires numpy. Install with: pip install scribify[vad]"
+        ) from exc
+    return numpy
+
+
+@dataclass
+class TimeMap:
+    """Maps positions in silence-stripped audio back to the original file.
+
+    ``spans`` are the kept ``(start_ms, end_ms)`` ranges of the original audio,
+    in order; the trimmed audio is their concatenation.
+    """
+
+    spans: List[Span] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._offsets: List[int] = []
+        total = 0
+        for start, end in self.spans:
+            self._offsets.append(total)
+            total += end - start
+        self.trimmed_ms = total
+
+    def to_original(self, trimmed_ms: int) -> int:
+        if not self.spans:
+            return trimmed_ms
+        idx = max(0, bisect.bisect_right(self._offsets, trimmed_ms) - 1)
+        start, end = self.spans[idx]
+        return min(end, start + trimmed_ms - self._offsets[idx])
+
+
+def speech_spans(
+    audio: AudioSegment,
+    frame_ms: int = VAD_FRAME_MS,
+    min_silence_ms: int = VAD_MIN_SILENCE_MS,
+    padding_ms: int = VAD_PADDING_MS,
+) -> List[Span]:
+    """Return the spans of ``audio`` to keep after cutting long silences.
+
+    Frames are classified by RMS energy against a threshold derived from the
+    recording's own noise floor and speech level; only silent runs of at least
+    ``min_silence_ms`` are cut, leaving ``padding_ms`` on either side.
+    """
+    np = _require_numpy()
+    duration_ms = len(audio)
+    mono = audio.set_channels(1) if audio.channels > 1 else audio
+    frame_len = int(mono.frame_rate * frame_ms / 1000)
+    samples = _samples_view(np, mono)
+    num_frames = len(samples) // frame_len if frame_len else 0
+    if num_frames == 0:
+        return [(0, duration_ms)] if duration_ms else []
+
+    frames = samples[: num_frames * frame_len].reshape(num_frames, frame_len)
+    energy = np.empty(num_frames, dtype=np.float64)
+    for start in range(0, num_frames, _RMS_BLOCK_FRAMES):
+        block = frames[start : start + _RMS_BLOCK_FRAMES].astype(np.float32)
+        energy[start : start + len(block)] = np.einsum("ij,ij->i", block, block)
+    full_scale = float(1 << (8 * mono.sample_width - 1))
+    rms = np.sqrt(energy / frame_len) / full_scale
+    dbfs = 20 * np.log10(np.maximum(rms, 1e-10))
+
+    noise_floor, speech_level = np.percentile(dbfs, [10, 90])
+    threshold = max(
+        VAD_MIN_THRESHOLD_DBFS,
+        min(noise_floor + VAD_NOISE_MARGIN_DB, speech_level - VAD_SPEECH_RANGE_DB),
+    )
+    silent = np.concatenate(([False], dbfs <= threshold, [False]))
+    edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+
+    spans: List[Span] = []
+    cursor = 0
+    for run_start, run_end in zip(edges[::2], edges[1::2]):
+        if (run_end - run_start) * frame_ms < min_silence_ms:
+            continue
+        cut_start = int(run_start) * frame_ms + padding_ms
+        cut_end = min(duration_ms, int(run_end) * frame_ms - padding_ms)
+        if run_start == 0:
+            cut_start = 0
+        if run_end == num_frames:
+            cut_end = duration_ms
+        if cut_end <= cut_start:
+            continue
+        if cut_start > cursor:
+            spans.append((cursor, cut_start))
+        cursor = cut_end
+    if cursor < duration_ms:
+        spans.append((cursor, duration_ms))
+    return spans
+
+
+def _samples_view(np, audio: AudioSegment):
+    # Read the PCM in place, with the signedness pydub's sample arrays use.
+    dtype = {1: np.int8, 2: np.dtype("<i2"), 4: np.dtype("<i4")}.get(audio.sample_width)
+    if dtype is None:
+        return np.asarray(audio.get_array_of_samples())
+    return np.frombuffer(audio.raw_data, dtype=dtype)
+
+
+def strip_silence(audio: AudioSegment, **kwargs) -> Tuple[AudioSegment, TimeMap]:
+    spans = speech_spans(audio, **kwargs)
+    time_map = TimeMap(spans)
+    raw = memoryview(audio.raw_data)
+    frame_width = audio.frame_width
+    pieces = []
+    for start_ms, end_ms in spans:
+        start = int(start_ms * audio.frame_rate / 1000) * frame_width
+        end = int(end_ms * audio.frame_rate / 1000) * frame_width
+        pieces.append(raw[start:end])
+    trimmed = AudioSegment(
+        data=b"".join(pieces),
+        sample_width=audio.sample_width,
+        frame_rate=audio.frame_rate,
+        channels=audio.channels,
+    )
+    return trimmed, time_map
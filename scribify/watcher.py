@@ -0,0 +1,230 @@
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from .audio_utils import get_audio_format
+from .constants import DEFAULT_CONCURRENCY, SUPPORTED_FORMATS, WATCH_POLL_SECONDS
+from .inotify import Inotify
+from .transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.replace(tmp_path, path)
+
+
+def _signature(path: str) -> Tuple[int, float]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+
+def _move_aside(path: str, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    target = os.path.join(directory, os.path.basename(path))
+    if os.path.exists(target):
+        stem, ext = os.path.splitext(os.path.basename(path))
+        target = os.path.join(directory, f"{stem}-{int(time.time())}{ext}")
+    shutil.move(path, target)
+    return target
+
+
+class FolderWatcher:
+    """Transcribe audio files as they appear in ``watch_dir``.
+
+    Completed files are detected with inotify where available, otherwise by
+    polling until a file's size and mtime settle. All files share one
+    ``transcriber`` and a pool of ``workers`` threads. Files whose content was
+    already transcribed reuse that transcript. Transcripts are written
+    atomically to ``output_dir``, named after the input and numbered when that
+    name is taken; inputs move to ``processed_dir``, or to ``failed_dir`` on
+    error. A file that cannot be moved is not picked up again until it changes.
+    """
+
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        watch_dir: str,
+        output_dir: Optional[str] = None,
+        processed_dir: Optional[str] = None,
+        failed_dir: Optional[str] = None,
+        workers: int = DEFAULT_CONCURRENCY,
+        poll_interval: float = WATCH_POLL_SECONDS,
+        use_inotify: bool = True,
+    ) -> None:
+        self.transcriber = transcriber
+        self.watch_dir = os.path.abspath(watch_dir)
+        self.output_dir = output_dir or os.path.join(self.watch_dir, "transcripts")
+        self.processed_dir = processed_dir or os.path.join(self.watch_dir, "processed")
+        self.failed_dir = failed_dir or os.path.join(self.watch_dir, "failed")
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._queued: Set[str] = set()
+        # Content hash -> future resolving to the transcript path for that content.
+        self._transcripts: Dict[str, Future] = {}
+        self._outputs: Set[str] = set()
+        # Finished files left in place because moving them failed -> (size, mtime).
+        self._unmovable: Dict[str, Tuple[int, float]] = {}
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        stop_event = stop_event or threading.Event()
+        os.makedirs(self.output_dir, exist_ok=True)
+        logger.info("Watching %s", self.watch_dir)
+        try:
+            for path in self._completed_files(stop_event):
+                self.submit(path)
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def submit(self, path: str) -> Optional[Future]:
+        if not self._is_candidate(path):
+            return None
+        with self._lock:
+            if path in self._queued:
+                return None
+            if path in self._unmovable:
+                try:
+                    if self._unmovable[path] == _signature(path):
+                        return None
+                except OSError:
+                    return None
+                del self._unmovable[path]
+            self._queued.add(path)
+        return self._pool.submit(self._process, path)
+
+    def _is_candidate(self, path: str) -> bool:
+        name = os.path.basename(path)
+        if name.startswith(".") or not os.path.isfile(path):
+            return False
+        return get_audio_format(name) in SUPPORTED_FORMATS
+
+    def _existing_files(self) -> Iterator[str]:
+        for entry in sorted(os.scandir(self.watch_dir), key=lambda entry: entry.name):
+            if entry.is_file():
+                yield entry.path
+
+    def _completed_files(self, stop_event: threading.Event) -> Iterator[str]:
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = Inotify(self.watch_dir)
+            except (OSError, AttributeError) as exc:
+                logger.info("inotify unavailable (%s); polling instead", exc)
+
+        if inotify is None:
+            yield from self._poll(stop_event)
+            return
+        try:
+            # Watch first, then scan, so nothing written in between is missed.
+            # Files still being written are left to their close event.
+            before = self._scan()
+            stop_event.wait(self.poll_interval)
+            after = self._scan()
+            for path, signature in before.items():
+                if after.get(path) == signature:
+                    yield path
+            while not stop_event.is_set():
+                for name in inotify.read(self.poll_interval):
+                    yield os.path.join(self.watch_dir, name)
+        finally:
+            inotify.close()
+
+    def _scan(self) -> Dict[str, Tuple[int, float]]:
+        signatures = {}
+        for path in self._existing_files():
+            try:
+                signatures[path] = _signature(path)
+            except OSError:
+                continue
+        return signatures
+
+    def _poll(self, stop_event: threading.Event) -> Iterator[str]:
+        seen: Dict[str, Tuple[int, float]] = {}
+        while not stop_event.is_set():
+            current = self._scan()
+            for path, signature in current.items():
+                # Unchanged since the previous scan: the writer is done.
+                if seen.get(path) == signature:
+                    yield path
+            seen = current
+            stop_event.wait(self.poll_interval)
+
+    def _process(self, path: str) -> None:
+        try:
+            self._transcribe_once(path)
+        except Exception as exc:
+            logger.error("Failed to transcribe %s: %s", path, exc)
+            self._settle(path, self.failed_dir)
+        else:
+            self._settle(path, self.processed_dir)
+        finally:
+            with self._lock:
+                self._queued.discard(path)
+
+    def _settle(self, path: str, directory: str) -> None:
+        try:
+            _move_aside(path, directory)
+        except OSError as exc:
+            logger.error("Cannot move %s to %s: %s", path, directory, exc)
+            try:
+                signature = _signature(path)
+            except OSError:
+                return
+            with self._lock:
+                self._unmovable[path] = signature
+
+    def _reserve_output(self, path: str) -> str:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        output_path = os.path.join(self.output_dir, f"{stem}.txt")
+        number = 0
+        with self._lock:
+            while output_path in self._outputs or os.path.exists(output_path):
+                number += 1
+                output_path = os.path.join(self.output_dir, f"{stem}-{number}.txt")
+            self._outputs.add(output_path)
+        return output_path
+
+    def _transcribe_once(self, path: str) -> None:
+        digest = _file_digest(path)
+        with self._lock:
+            future = self._transcripts.get(digest)
+            owner = future is None
+            if owner:
+                future = self._transcripts[digest] = Future()
+
+        output_path = self._reserve_output(path)
+        if not owner:
+            source_output = future.result()
+            with open(source_output, "r", encoding="utf-8") as handle:
+                _write_atomic(output_path, handle.read())
+            logger.info("%s duplicates an earlier file; reused its transcript", path)
+            return
+
+        try:
+            text = self.transcriber.transcribe(path)
+            _write_atomic(output_path, text)
+        except BaseException as exc:
+            with self._lock:
+                del self._transcripts[digest]
+            future.set_exception(exc)
+            raise
+        future.set_result(output_path)
+        logger.info("Transcribed %s -> %s", path, output_path)
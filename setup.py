@@ -12,6 +12,10 @@ setup(
         "python-dotenv>=1.0.0",
         "tenacity>=8.2.3",
     ],
+    extras_require={
+        "vad": ["numpy>=1.24.0"],
+        "local": ["faster-whisper>=1.0.0"],
+    },
     entry_points={
         "console_scripts": ["scribify=scribify.cli:main"],
     },
@@ -0,0 +1,115 @@
+const uploadArea = document.getElementById('uploadArea');
+const fileInput = document.getElementById('fileInput');
+const fileInfo = document.getElementById('fileInfo');
+const uploadBtn = document.getElementById('uploadBtn');
+const status = document.getElementById('status');
+const result = document.getElementById('result');
+
+let selectedFile = null;
+let currentJobId = null;
+
+uploadArea.addEventListener('click', () => fileInput.click());
+
+uploadArea.addEventListener('dragover', (e) => {
+    e.preventDefault();
+    uploadArea.classList.add('dragover');
+});
+
+uploadArea.addEventListener('dragleave', () => {
+    uploadArea.classList.remove('dragover');
+});
+
+uploadArea.addEventListener('drop', (e) => {
+    e.preventDefault();
+    uploadArea.classList.remove('dragover');
+
+    const files = e.dataTransfer.files;
+    if (files.length > 0) {
+        handleFileSelect(files[0]);
+    }
+});
+
+fileInput.addEventListener('change', (e) => {
+    if (e.target.files.length > 0) {
+        handleFileSelect(e.target.files[0]);
+    }
+});
+
+function handleFileSelect(file) {
+    selectedFile = file;
+    fileInfo.textContent = `Selected: ${file.name} (${(file.size / 1024 / 1024).toFixed(2)} MB)`;
+    fileInfo.style.display = 'block';
+    uploadBtn.disabled = false;
+    status.style.display = 'none';
+    result.style.display = 'none';
+}
+
+uploadBtn.addEventListener('click', async () => {
+    if (!selectedFile) return;
+
+    uploadBtn.disabled = true;
+    status.className = 'status processing';
+    status.style.display = 'block';
+    status.innerHTML = '<div class="spinner"></div><div>Uploading and transcribing...</div>';
+    result.style.display = 'none';
+
+    const formData = new FormData();
+    formData.append('file', selectedFile);
+
+    try {
+        const response = await fetch('/transcribe', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (!response.ok) {
+            throw new Error(`Upload failed: ${response.statusText}`);
+        }
+
+        const data = await response.json();
+        currentJobId = data.job_id;
+
+        pollJobStatus(currentJobId);
+    } catch (error) {
+        status.className = 'status error';
+        status.innerHTML = `❌ Error: ${error.message}`;
+        uploadBtn.disabled = false;
+    }
+});
+
+async function pollJobStatus(jobId) {
+    try {
+        const response = await fetch(`/status/${jobId}?include_result=false`);
+        const data = await response.json();
+
+        if (data.status === 'completed') {
+            status.className = 'status success';
+            status.innerHTML = '✅ Transcription completed!';
+            const transcript = await fetch(data.result_url);
+            result.style.display = 'block';
+            result.textContent = await transcript.text();
+
+            const downloadBtn = document.createElement('a');
+            downloadBtn.className = 'download-btn';
+            downloadBtn.textContent = '📥 Download Transcript';
+            downloadBtn.href = data.result_url;
+            downloadBtn.download = 'transcript.txt';
+
+            if (!document.querySelector('.download-btn')) {
+                result.parentElement.insertBefore(downloadBtn, result.nextSibling);
+            }
+
+            uploadBtn.disabled = false;
+        } else if (data.status === 'failed') {
+            status.className = 'status error';
+            status.innerHTML = `❌ Transcription failed: ${data.error}`;
+            uploadBtn.disabled = false;
+        } else {
+            setTimeout(() => pollJobStatus(jobId), 2000);
+        }
+    } catch (error) {
+        status.className = 'status error';
+        status.innerHTML = `❌ Error checking status: ${error.message}`;
+        uploadBtn.disabled = false;
+    }
+}
@@ -0,0 +1,81 @@
+import asyncio
+
+from scribify import admission as admission_module
+from scribify.admission import AdmissionController, ResourceEstimate, estimate_job
+
+MB = 1024 * 1024
+
+
+def test_small_file_costs_its_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(admission_module, "probe_audio", lambda *_: {"duration_seconds": 60.0})
+    path = tmp_path / "clip.mp3"
+    path.write_bytes(b"x" * MB)
+
+    estimate = estimate_job(str(path), model="whisper-1")
+
+    assert estimate.disk_bytes == MB
+    assert estimate.memory_bytes == 65 * MB
+
+
+def test_chunked_file_scales_with_decoded_pcm(tmp_path, monkeypatch):
+    info = {"duration_seconds": 3600.0, "sample_rate": 16000.0, "channels": 1.0}
+    monkeypatch.setattr(admission_module, "probe_audio", lambda *_: info)
+    path = tmp_path / "long.m4a"
+    path.write_bytes(b"x" * MB)
+
+    estimate = estimate_job(str(path), model="gpt-4o-mini-transcribe")
+
+    pcm = 3600 * 16000 * 2
+    assert estimate.memory_bytes == 64 * MB + 2 * pcm
+    assert estimate.disk_bytes == MB + 3600 * 16000
+
+
+def test_frame_split_mp3_is_not_decoded(tmp_path, monkeypatch):
+    info = {"duration_seconds": 3600.0, "sample_rate": 16000.0, "channels": 1.0}
+    monkeypatch.setattr(admission_module, "probe_audio", lambda *_: info)
+    path = tmp_path / "long.mp3"
+    path.write_bytes(b"x" * MB)
+
+    estimate = estimate_job(str(path), model="gpt-4o-mini-transcribe")
+    stripped = estimate_job(str(path), model="gpt-4o-mini-transcribe", strip_silence=True)
+
+    assert estimate == ResourceEstimate(memory_bytes=65 * MB, disk_bytes=2 * MB)
+    assert stripped.memory_bytes == 64 * MB + 3 * 3600 * 16000 * 2
+
+
+def test_jobs_wait_until_budget_frees_in_order():
+    async def scenario():
+        controller = AdmissionController(memory_budget_bytes=100, disk_budget_bytes=100)
+        big = ResourceEstimate(memory_bytes=80, disk_bytes=10)
+        small = ResourceEstimate(memory_bytes=10, disk_bytes=10)
+        order = []
+
+        async def job(name, estimate, hold):
+            async with controller.reserve(estimate):
+                order.append(name)
+                await asyncio.sleep(hold)
+
+        first = asyncio.create_task(job("first", big, 0.05))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(job("second", big, 0))
+        await asyncio.sleep(0)
+        third = asyncio.create_task(job("third", small, 0))
+        await asyncio.sleep(0)
+        assert controller.queued == 2
+        await asyncio.gather(first, second, third)
+        return order, controller
+
+    order, controller = asyncio.run(scenario())
+
+    # "third" would fit beside "first" but must not jump the queue.
+    assert order == ["first", "second", "third"]
+    assert controller.running == 0 and controller.memory_in_use == 0
+
+
+def test_oversized_job_runs_alone():
+    async def scenario():
+        controller = AdmissionController(memory_budget_bytes=10, disk_budget_bytes=10)
+        async with controller.reserve(ResourceEstimate(memory_bytes=50, disk_bytes=50)):
+            return controller.running
+
+    assert asyncio.run(scenario()) == 1
@@ -0,0 +1,152 @@
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+
+from scribify import api as api_module
+from scribify.exceptions import WhisperCLIError
+from scribify.transcriber import Transcriber
+
+
+class AsyncDummyClient:
+    model = "whisper-1"
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+    async def transcribe_with_retries(self, source, filename=None):
+        self.calls.append((source, filename))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return f"text-{filename}", 1
+
+
+class DummyChunker:
+    def __init__(self, chunks, spans):
+        self._chunks = chunks
+        self.spans = spans
+        self.cleaned = False
+
+    def chunk_audio(self, file_path, format=None):
+        return self._chunks
+
+    def cleanup_chunks(self, chunk_paths):
+        self.cleaned = True
+
+
+def test_transcribe_async_bytes_uploads_directly():
+    client = AsyncDummyClient()
+    transcriber = Transcriber(client=client, quiet=True)
+
+    result = asyncio.run(transcriber.transcribe_async(b"abcd", filename="clip.wav"))
+
+    assert result.text == "text-clip.wav"
+    assert client.calls == [(b"abcd", "clip.wav")]
+    assert result.retries == 1
+    assert result.bytes_uploaded == 8
+
+
+def test_transcribe_async_file_object_uses_its_name():
+    client = AsyncDummyClient()
+    handle = io.BytesIO(b"xyz")
+    handle.name = "/recordings/call.m4a"
+    transcriber = Transcriber(client=client, quiet=True)
+
+    result = asyncio.run(transcriber.transcribe_async(handle))
+
+    assert client.calls == [(b"xyz", "call.m4a")]
+    assert result.text == "text-call.m4a"
+
+
+def test_transcribe_async_chunks_keep_order_and_spans(monkeypatch, tmp_path):
+    monkeypatch.setattr("scribify.transcriber.validate_audio_file", lambda *_: None)
+    monkeypatch.setattr("scribify.transcriber.get_file_size_mb", lambda *_: 30)
+    chunks = []
+    for name in ("chunk_001.mp3", "chunk_002.mp3", "chunk_003.mp3"):
+        path = tmp_path / name
+        path.write_bytes(b"12")
+        chunks.append(str(path))
+    chunker = DummyChunker(chunks, [(0, 10), (10, 20), (20, 30)])
+    client = AsyncDummyClient()
+    transcriber = Transcriber(client=client, chunker=chunker, quiet=True)
+
+    result = asyncio.run(transcriber.transcribe_async("long.mp3"))
+
+    assert result.text == "text-chunk_001.mp3\ntext-chunk_002.mp3\ntext-chunk_003.mp3"
+    assert [(chunk.start_ms, chunk.end_ms) for chunk in result.chunks] == [
+        (0, 10),
+        (10, 20),
+        (20, 30),
+    ]
+    assert result.bytes_uploaded == 3 * 2 * 2
+    assert chunker.cleaned
+
+
+def test_chunking_errors_are_wrapped(monkeypatch):
+    monkeypatch.setattr("scribify.transcriber.validate_audio_file", lambda *_: None)
+    monkeypatch.setattr("scribify.transcriber.get_file_size_mb", lambda *_: 30)
+
+    class UnwritableChunker(DummyChunker):
+        def chunk_audio(self, file_path, format=None):
+            raise PermissionError("temp_chunks")
+
+    transcriber = Transcriber(
+        client=AsyncDummyClient(), chunker=UnwritableChunker([], []), quiet=True
+    )
+
+    with pytest.raises(WhisperCLIError):
+        transcriber.transcribe_result("long.mp3")
+    with pytest.raises(WhisperCLIError):
+        asyncio.run(transcriber.transcribe_async("long.mp3"))
+
+
+def test_transcribe_many_shares_concurrency(monkeypatch):
+    client = AsyncDummyClient()
+    monkeypatch.setattr(
+        api_module,
+        "_build_transcriber",
+        lambda *args, **kwargs: Transcriber(client=client, quiet=True),
+    )
+
+    sources = [(f"clip{idx}.mp3", b"data") for idx in range(6)]
+    results = asyncio.run(api_module.transcribe_many(sources, concurrency=2))
+
+    assert [result.text for result in results] == [f"text-clip{idx}.mp3" for idx in range(6)]
+    assert client.max_in_flight == 2
+
+
+def test_transcribe_many_bounds_preparation_and_closes_client(monkeypatch):
+    client = AsyncDummyClient()
+    transcriber = Transcriber(client=client, quiet=True)
+    monkeypatch.setattr(api_module, "_build_transcriber", lambda *args, **kwargs: transcriber)
+    lock = threading.Lock()
+    preparing = []
+    peak = []
+    prepare = transcriber._prepare
+
+    def slow_prepare(source, filename):
+        with lock:
+            preparing.append(filename)
+            peak.append(len(preparing))
+        time.sleep(0.02)
+        with lock:
+            preparing.remove(filename)
+        return prepare(source, filename)
+
+    monkeypatch.setattr(transcriber, "_prepare", slow_prepare)
+
+    sources = [(f"clip{idx}.mp3", b"data") for idx in range(6)]
+    asyncio.run(api_module.transcribe_many(sources, concurrency=2))
+
+    assert max(peak) == 2
+    assert client.closed
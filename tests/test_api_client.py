@@ -1,8 +1,15 @@
+import asyncio
+import threading
+
 import pytest
 
 pytest.importorskip("openai")
 
-from whisper_cli import api_client as api_client_module
+import httpx
+from openai import APITimeoutError
+
+from scribify import api_client as api_client_module
+from scribify.exceptions import ChunkTooLargeError
 
 
 class DummyResult:
@@ -11,7 +18,7 @@ class DummyResult:
 
 
 class DummyTranscriptions:
-    def create(self, model, file, response_format):
+    def create(self, model, file, response_format, timeout=None):
         return DummyResult("ok")
 
 
@@ -26,7 +33,7 @@ class DummyClient:
 
 
 def test_transcribe_file_returns_text(tmp_path, monkeypatch):
-    monkeypatch.setattr(api_client_module, "OpenAI", lambda api_key: DummyClient())
+    monkeypatch.setattr(api_client_module, "OpenAI", lambda **kwargs: DummyClient())
     client = api_client_module.OpenAITranscriptionClient(api_key="test")
 
     audio_path = tmp_path / "sample.mp3"
@@ -34,3 +41,62 @@ def test_transcribe_file_returns_text(tmp_path, monkeypatch):
 
     result = client.transcribe_file(str(audio_path))
     assert result == "ok"
+
+
+def test_timeout_splits_without_retrying(tmp_path, monkeypatch):
+    built = {}
+    timeouts = []
+
+    class TimingOut:
+        def create(self, model, file, response_format, timeout=None):
+            timeouts.append(timeout)
+            raise APITimeoutError(request=httpx.Request("POST", "https://api.openai.com"))
+
+    def build(**kwargs):
+        built.update(kwargs)
+        client = DummyClient()
+        client.audio.transcriptions = TimingOut()
+        return client
+
+    monkeypatch.setattr(api_client_module, "OpenAI", build)
+    client = api_client_module.OpenAITranscriptionClient(api_key="test", timeout=100)
+    audio_path = tmp_path / "sample.mp3"
+    audio_path.write_bytes(b"x" * 20 * 1024 * 1024)
+
+    with pytest.raises(ChunkTooLargeError):
+        client.transcribe_with_retries(str(audio_path))
+
+    assert built["max_retries"] == 0
+    assert timeouts == [80]
+
+
+def test_async_client_reads_files_off_the_loop(tmp_path, monkeypatch):
+    readers = []
+    read_upload = api_client_module._read_upload
+
+    def recording_read(path):
+        readers.append(threading.get_ident())
+        return read_upload(path)
+
+    class AsyncTranscriptions:
+        async def create(self, model, file, response_format, timeout=None):
+            return DummyResult(file[1].decode())
+
+    def build(**kwargs):
+        client = DummyClient()
+        client.audio.transcriptions = AsyncTranscriptions()
+        return client
+
+    monkeypatch.setattr(api_client_module, "AsyncOpenAI", build)
+    monkeypatch.setattr(api_client_module, "_read_upload", recording_read)
+    audio_path = tmp_path / "sample.mp3"
+    audio_path.write_bytes(b"audio")
+
+    async def scenario():
+        client = api_client_module.AsyncOpenAITranscriptionClient(api_key="test")
+        return await client.transcribe_file(str(audio_path)), threading.get_ident()
+
+    text, loop_thread = asyncio.run(scenario())
+
+    assert text == "audio"
+    assert readers and loop_thread not in readers
@@ -0,0 +1,71 @@
+import sys
+
+import pytest
+
+openai = pytest.importorskip("openai")
+httpx = pytest.importorskip("httpx")
+
+from scribify.backends import LocalWhisperBackend, RoutingBackend
+from scribify.exceptions import APIError
+
+
+class RecordingBackend:
+    def __init__(self, name, error=None):
+        self.model = name
+        self.error = error
+        self.calls = []
+
+    def transcribe_with_retries(self, source, filename=None):
+        self.calls.append(source)
+        if self.error:
+            raise self.error
+        return self.model, 0
+
+
+def _router(remote_error=None):
+    remote = RecordingBackend("remote", remote_error)
+    local = RecordingBackend("local")
+    router = RoutingBackend(remote=remote, local=local, max_local_seconds=10)
+    return router, remote, local
+
+
+def test_short_clips_go_local():
+    router, remote, local = _router()
+
+    assert router.transcribe_with_retries(b"x" * 16000) == ("local", 0)
+    assert remote.calls == []
+
+
+def test_long_clips_go_remote():
+    router, remote, local = _router()
+
+    assert router.transcribe_with_retries(b"x" * 16000 * 60) == ("remote", 0)
+    assert local.calls == []
+
+
+def test_spills_to_local_when_api_unavailable():
+    error = openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+    router, remote, local = _router(error)
+    long_clip = b"x" * 16000 * 60
+
+    assert router.transcribe_with_retries(long_clip) == ("local", 0)
+    assert router.transcribe_with_retries(long_clip) == ("local", 0)
+    assert len(remote.calls) == 1
+    assert len(local.calls) == 2
+
+
+def test_request_errors_are_not_rerouted():
+    router, remote, local = _router(APIError("bad request"))
+
+    with pytest.raises(APIError):
+        router.transcribe_with_retries(b"x" * 16000 * 60)
+    assert local.calls == []
+
+
+def test_local_availability_check_does_not_import_engine(monkeypatch):
+    monkeypatch.delitem(sys.modules, "faster_whisper", raising=False)
+
+    available = LocalWhisperBackend.is_available()
+
+    assert "faster_whisper" not in sys.modules
+    assert isinstance(available, bool)
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from scribify.backends import create_backend
+from scribify.cassette import (
+    AsyncReplayClient,
+    Cassette,
+    Interaction,
+    RecordingClient,
+    ReplayClient,
+    interaction_key,
+)
+from scribify.config import Config
+from scribify.exceptions import APIError, CassetteError, ChunkTooLargeError
+from scribify.transcriber import Transcriber
+
+
+class RateLimitError(Exception):
+    """Stands in for the SDK error of the same name."""
+
+
+class LiveClient:
+    model = "whisper-1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe_with_retries(self, source, filename=None):
+        self.calls += 1
+        if source == b"huge":
+            raise ChunkTooLargeError("too large")
+        if source == b"busy":
+            raise RateLimitError("slow down")
+        return source.decode().upper(), 1
+
+
+def _record(path):
+    recorder = RecordingClient(LiveClient(), Cassette.create(str(path)))
+    recorder.transcribe_with_retries(b"hello", filename="a.mp3")
+    with pytest.raises(ChunkTooLargeError):
+        recorder.transcribe_with_retries(b"huge")
+    with pytest.raises(RateLimitError):
+        recorder.transcribe_with_retries(b"busy")
+    return recorder
+
+
+def test_replay_returns_recorded_responses_and_errors(tmp_path):
+    path = tmp_path / "run.cassette"
+    _record(path)
+
+    replay = ReplayClient(Cassette.load(str(path)), model="whisper-1", realtime=False)
+
+    assert replay.transcribe_with_retries(b"hello") == ("HELLO", 1)
+    with pytest.raises(ChunkTooLargeError):
+        replay.transcribe_with_retries(b"huge")
+    with pytest.raises(APIError, match="RateLimitError: slow down"):
+        replay.transcribe_with_retries(b"busy")
+    with pytest.raises(CassetteError):
+        replay.transcribe_with_retries(b"never recorded")
+
+
+def test_replay_keeps_recorded_latency(tmp_path):
+    key = interaction_key("whisper-1", b"slow")
+    cassette = Cassette(str(tmp_path / "c"), [Interaction(key, "whisper-1", 4, 0.1, text="ok")])
+
+    started = time.perf_counter()
+    assert ReplayClient(cassette, model="whisper-1").transcribe_with_retries(b"slow")[0] == "ok"
+    assert time.perf_counter() - started >= 0.1
+
+    async def run_concurrently():
+        client = AsyncReplayClient(cassette, model="whisper-1")
+        return await asyncio.gather(*(client.transcribe_with_retries(b"slow") for _ in range(5)))
+
+    started = time.perf_counter()
+    assert len(asyncio.run(run_concurrently())) == 5
+    assert time.perf_counter() - started < 0.4
+
+
+def test_misses_can_be_synthesized_from_latency_fit(tmp_path):
+    interactions = [
+        Interaction(interaction_key("m", bytes(size)), "m", size, 1.0 + size / 1000, text="x")
+        for size in (1000, 2000, 4000)
+    ]
+    cassette = Cassette(str(tmp_path / "c"), interactions)
+
+    assert cassette.latency_model() == pytest.approx((1.0, 0.001))
+    replay = ReplayClient(cassette, model="m", realtime=False, synthesize_misses=True)
+    text, retries = replay.transcribe_with_retries(bytes(3000) + b"new")
+    assert text.startswith("[unrecorded")
+    assert retries == 0
+
+
+def test_replay_through_config_needs_no_api_key(tmp_path, monkeypatch):
+    path = tmp_path / "run.cassette"
+    _record(path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    audio = tmp_path / "clip.mp3"
+    audio.write_bytes(b"hello")
+    monkeypatch.setattr("scribify.transcriber.validate_audio_file", lambda *_: None)
+    monkeypatch.setattr("scribify.transcriber.get_file_size_mb", lambda *_: 0.1)
+
+    config = Config.load(model="whisper-1", cassette=str(path), cassette_mode="instant")
+    client = create_backend(config)
+
+    assert isinstance(client, ReplayClient)
+    assert Transcriber(client=client, quiet=True).transcribe(str(audio)) == "HELLO"
+
+
+def test_corrupt_cassette(tmp_path):
+    path = tmp_path / "bad.cassette"
+    path.write_text("not json\n", encoding="utf-8")
+
+    with pytest.raises(CassetteError):
+        Cassette.load(str(path))
@@ -4,7 +4,7 @@ import pytest
 
 pytest.importorskip("pydub")
 
-from whisper_cli import chunker as chunker_module
+from scribify import chunker as chunker_module
 
 
 class FakeAudio:
@@ -19,15 +19,16 @@ class FakeAudio:
         stop = item.stop or self.duration_ms
         return FakeAudio(stop - start)
 
-    def export(self, path: str, format: str) -> None:
+    def export(self, path: str, format: str, bitrate: str = None) -> None:
         with open(path, "wb") as handle:
             handle.write(b"fake audio")
 
 
 def test_chunker_creates_chunks(tmp_path, monkeypatch):
     monkeypatch.setattr(chunker_module, "TEMP_CHUNK_DIR", str(tmp_path))
-    monkeypatch.setattr(chunker_module, "AudioSegment", type("X", (), {"from_file": lambda *_: FakeAudio(10000)}))
-    monkeypatch.setattr(chunker_module, "get_file_size_mb", lambda *_: 50)
+    monkeypatch.setattr(
+        chunker_module, "AudioSegment", type("X", (), {"from_file": lambda *_: FakeAudio(3600000)})
+    )
 
     audio_chunker = chunker_module.AudioChunker(chunk_size_mb=20)
     chunks = audio_chunker.chunk_audio("sample.mp3")
@@ -39,3 +40,18 @@ def test_chunker_creates_chunks(tmp_path, monkeypatch):
     audio_chunker.cleanup_chunks(chunks)
     for chunk in chunks:
         assert not os.path.exists(chunk)
+
+
+def test_chunker_resplits_oversized_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunker_module, "TEMP_CHUNK_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        chunker_module, "AudioSegment", type("X", (), {"from_file": lambda *_: FakeAudio(600000)})
+    )
+    sizes = iter([30, 10, 10])
+    monkeypatch.setattr(chunker_module, "get_file_size_mb", lambda *_: next(sizes))
+
+    audio_chunker = chunker_module.AudioChunker(chunk_size_mb=20)
+    chunks = audio_chunker.chunk_audio("sample.mp3")
+
+    assert [os.path.basename(chunk) for chunk in chunks] == ["chunk_002.mp3", "chunk_003.mp3"]
+    audio_chunker.cleanup_chunks(chunks)
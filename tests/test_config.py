@@ -1,8 +1,8 @@
 import os
 import pytest
 
-from whisper_cli.config import Config
-from whisper_cli.exceptions import ConfigurationError
+from scribify.config import Config
+from scribify.exceptions import ConfigurationError
 
 
 def test_config_load_from_env(monkeypatch):
@@ -15,3 +15,24 @@ def test_config_missing_key(monkeypatch):
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
     with pytest.raises(ConfigurationError):
         Config.load()
+
+
+def test_config_local_backend_needs_no_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    config = Config.load(backend="local")
+    assert config.backend == "local"
+
+
+def test_config_rejects_unknown_backend(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    with pytest.raises(ConfigurationError):
+        Config.load(backend="bogus")
+
+
+def test_config_reads_request_timeout(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_TIMEOUT", "45")
+    assert Config.load().timeout == 45
+    monkeypatch.setenv("OPENAI_TIMEOUT", "soon")
+    with pytest.raises(ConfigurationError):
+        Config.load()
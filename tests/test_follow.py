@@ -0,0 +1,82 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from scribify import streaming as streaming_module
+from scribify.follow import GrowingFileReader
+from scribify.transcriber import Transcriber
+
+
+def _write_slowly(path, parts, delay):
+    def run():
+        with open(path, "ab") as handle:
+            for part in parts:
+                time.sleep(delay)
+                handle.write(part)
+                handle.flush()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_reader_waits_for_growth_until_idle(tmp_path):
+    path = tmp_path / "call.wav"
+    path.write_bytes(b"head")
+    writer = _write_slowly(path, [b"one", b"two"], delay=0.05)
+
+    with GrowingFileReader(
+        str(path), idle_timeout=0.3, poll_interval=0.01, use_inotify=False
+    ) as reader:
+        data = b"".join(iter(lambda: reader.read(4), b""))
+
+    writer.join()
+    assert data == b"headonetwo"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_reader_finishes_when_writer_closes(tmp_path):
+    path = tmp_path / "call.mp3"
+    path.write_bytes(b"")
+    writer = _write_slowly(path, [b"a" * 10, b"b" * 10], delay=0.05)
+
+    started = time.monotonic()
+    with GrowingFileReader(str(path), idle_timeout=30, poll_interval=0.05) as reader:
+        data = b"".join(iter(lambda: reader.read(1024), b""))
+
+    writer.join()
+    assert data == b"a" * 10 + b"b" * 10
+    assert time.monotonic() - started < 5
+
+
+def test_transcribe_follow_emits_each_chunk(tmp_path, monkeypatch):
+    path = tmp_path / "call.wav"
+    path.write_bytes(b"audio")
+    seen = {}
+
+    def fake_iter_chunks(self, stream):
+        seen["options"] = self.input_options
+        seen["chunk_bytes"] = self.chunk_bytes
+        seen["data"] = stream.read()
+        yield from [(b"one", 0, 1000), (b"two", 1000, 2000)]
+
+    monkeypatch.setattr(streaming_module.StreamingChunker, "iter_chunks", fake_iter_chunks)
+
+    class Client:
+        model = "gpt-4o-mini-transcribe"
+
+        def transcribe_with_retries(self, source, filename=None):
+            return source.decode(), 0
+
+    emitted = []
+    result = Transcriber(client=Client(), quiet=True).transcribe_follow(
+        str(path), on_chunk=lambda chunk: emitted.append(chunk.text), idle_timeout=0.1
+    )
+
+    assert emitted == ["one", "two"]
+    assert result.text == "one\ntwo"
+    assert seen["data"] == b"audio"
+    assert seen["options"] == ["-ignore_length", "1"]
+    assert seen["chunk_bytes"] == 60 * 128 * 1000 // 8
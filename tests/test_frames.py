@@ -0,0 +1,165 @@
+import os
+
+import pytest
+
+from scribify import chunker as chunker_module
+from scribify import frames as frames_module
+from scribify.exceptions import ChunkingError
+from scribify.frames import frame_ranges
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames, 418 with padding.
+FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\0" * 413
+PADDED = bytes([0xFF, 0xFB, 0x92, 0x00]) + b"\0" * 414
+ID3 = b"ID3\x03\x00\x00\x00\x00\x00\x05hello"
+# LAME's CBR header frame: a silent frame whose payload starts with "Info".
+INFO = FRAME[:36] + b"Info" + FRAME[40:]
+# AAC-LC ADTS, 44.1 kHz stereo, 200-byte frames of 1024 samples.
+ADTS = bytes([0xFF, 0xF1, 0x50, 0x80, 0x19, 0x1F, 0xFC]) + b"\0" * 193
+
+
+def _cbr_stream(frames: int) -> bytes:
+    # Pad as an encoder would to average 144 * 128000 / 44100 bytes per frame.
+    out = bytearray(ID3)
+    debt = 0.0
+    for _ in range(frames):
+        debt += 144 * 128000 / 44100 - 417
+        if debt >= 1:
+            debt -= 1
+            out += PADDED
+        else:
+            out += FRAME
+    return bytes(out)
+
+
+def _walk_only(monkeypatch):
+    monkeypatch.setattr(frames_module, "_mp3_cbr_ranges", lambda *_: None)
+
+
+@pytest.mark.parametrize("max_bytes,max_seconds", [(100000, None), (50000, 3.0), (10**6, 1.0)])
+def test_cbr_fast_path_matches_full_walk(monkeypatch, max_bytes, max_seconds):
+    data = _cbr_stream(5000)
+
+    assert frames_module._mp3_cbr_ranges(data, len(ID3), max_bytes, max_seconds) is not None
+    fast = frame_ranges(data, max_bytes, max_seconds)
+    _walk_only(monkeypatch)
+    walked = frame_ranges(data, max_bytes, max_seconds)
+
+    assert [(r.start, r.end) for r in fast] == [(r.start, r.end) for r in walked]
+    assert fast[-1].end_seconds == pytest.approx(walked[-1].end_seconds)
+
+
+def test_ranges_cover_buffer_on_frame_boundaries(monkeypatch):
+    _walk_only(monkeypatch)
+    data = ID3 + FRAME * 10 + b"TAG" + b"\0" * 125
+
+    ranges = frame_ranges(data, max_bytes=417 * 3 + len(ID3))
+
+    assert ranges[0].start == len(ID3)
+    assert ranges[-1].end == len(data)
+    assert all(a.end == b.start for a, b in zip(ranges, ranges[1:]))
+    for frame_range in ranges[1:]:
+        assert data[frame_range.start : frame_range.start + 4] == FRAME[:4]
+    assert ranges[-1].end_seconds == pytest.approx(10 * 1152 / 44100)
+
+
+@pytest.mark.parametrize("tag", [b"Info", b"Xing"])
+def test_header_frame_is_left_out(monkeypatch, tag):
+    data = ID3 + FRAME[:36] + tag + FRAME[40:] + _cbr_stream(2000)[len(ID3) :]
+
+    fast = frame_ranges(data, max_bytes=100000)
+    _walk_only(monkeypatch)
+    walked = frame_ranges(data, max_bytes=100000)
+
+    for ranges in (fast, walked):
+        assert ranges[0].start == len(ID3) + len(FRAME)
+        assert all(tag not in data[r.start : r.end] for r in ranges)
+        assert ranges[-1].end_seconds == pytest.approx(2000 * 1152 / 44100)
+
+
+def test_vbr_without_header_is_walked():
+    # A loud opening at 320 kbps, then a long quiet stretch at 32 kbps.
+    loud = bytes([0xFF, 0xFB, 0xE0, 0x00]) + b"\0" * 1040
+    quiet = bytes([0xFF, 0xFB, 0x10, 0x00]) + b"\0" * 100
+    data = loud * 200 + quiet * 70000
+
+    ranges = frame_ranges(data, max_bytes=20 * 1024 * 1024, max_seconds=1400)
+
+    assert len(ranges) == 2
+    assert ranges[0].end_seconds <= 1400
+    assert ranges[-1].end_seconds == pytest.approx(70200 * 1152 / 44100)
+
+
+def test_ranges_respect_duration_limit():
+    data = FRAME * 100
+
+    ranges = frame_ranges(data, max_bytes=10**6, max_seconds=0.5)
+
+    assert all(r.end_seconds - r.start_seconds <= 0.5 for r in ranges)
+    assert len(ranges) == 6
+
+
+def test_no_frames_found():
+    assert frame_ranges(b"not audio" * 100, max_bytes=1000) == []
+
+
+def test_chunker_copies_frames_without_decoding(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunker_module, "TEMP_CHUNK_DIR", str(tmp_path / "chunks"))
+
+    def fail(*_):
+        raise AssertionError("decoded")
+
+    monkeypatch.setattr(chunker_module, "AudioSegment", type("X", (), {"from_file": fail}))
+    source = tmp_path / "talk.mp3"
+    data = ID3 + INFO + _cbr_stream(3000)[len(ID3) :]
+    source.write_bytes(data)
+
+    audio_chunker = chunker_module.AudioChunker(chunk_size_mb=1)
+    chunks = audio_chunker.chunk_audio(str(source))
+
+    assert len(chunks) == 2
+    assert all(path.endswith(".mp3") for path in chunks)
+    assert b"".join(open(path, "rb").read() for path in chunks) == data[len(ID3) + len(INFO) :]
+    assert audio_chunker.spans[0][0] == 0
+    assert audio_chunker.spans[0][1] == audio_chunker.spans[1][0]
+
+    halves = audio_chunker.bisect_chunk(chunks[0])
+    assert len(halves) == 2
+    assert halves[0][1] == 0 and halves[1][2] == audio_chunker.spans[0][1]
+    audio_chunker.cleanup_chunks(chunks + [path for path, _, _ in halves])
+    assert not os.listdir(tmp_path / "chunks")
+
+
+def test_bisect_refuses_tiny_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunker_module, "TEMP_CHUNK_DIR", str(tmp_path))
+
+    with pytest.raises(ChunkingError):
+        chunker_module.AudioChunker().bisect_chunk(FRAME * 4, "mp3")
+
+
+def test_adts_input_is_reencoded_to_an_accepted_container(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunker_module, "TEMP_CHUNK_DIR", str(tmp_path / "chunks"))
+    decoded = []
+
+    class FakeAudio:
+        def __len__(self):
+            return 3600000
+
+        def __getitem__(self, item):
+            return self
+
+        def export(self, path, format, bitrate=None):
+            with open(path, "wb") as handle:
+                handle.write(b"mp3")
+
+    def from_file(path, format=None):
+        decoded.append(path)
+        return FakeAudio()
+
+    monkeypatch.setattr(chunker_module, "AudioSegment", type("X", (), {"from_file": from_file}))
+    source = tmp_path / "talk.aac"
+    source.write_bytes(ADTS * 100)
+
+    chunks = chunker_module.AudioChunker(chunk_size_mb=20).chunk_audio(str(source))
+
+    assert decoded == [str(source)]
+    assert chunks and all(path.endswith(".mp3") for path in chunks)
@@ -0,0 +1,63 @@
+import gzip
+
+import pytest
+
+from scribify.http_cache import etag_matches, negotiate_encoding, parse_range, precompress
+
+
+def test_precompress_skips_small_bodies():
+    assert precompress(b"tiny").encoded == {}
+
+    body = precompress(b"transcript " * 100)
+    assert gzip.decompress(body.encoded["gzip"]) == b"transcript " * 100
+    assert len(set(body.etags())) == len(body.etags())
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ["br", "gzip"]) == expected
+
+
+def test_negotiate_skips_unavailable_encodings():
+    assert negotiate_encoding("br, gzip", ["gzip"]) == "gzip"
+
+
+def test_etag_matches():
+    assert etag_matches('"a", W/"b"', ['"b"'])
+    assert etag_matches("*", ['"a"'])
+    assert not etag_matches('"a"', ['"b"'])
+    assert not etag_matches(None, ['"a"'])
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=90-", (90, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=95-200", (95, 99)),
+        ("bytes=0-1,5-6", None),
+        ("bytes=9-1", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=-0"])
+def test_unsatisfiable_range(header):
+    with pytest.raises(ValueError):
+        parse_range(header, 100)
@@ -1,4 +1,4 @@
-from whisper_cli.merger import merge_transcriptions
+from scribify.merger import merge_transcriptions
 
 
 def test_merge_transcriptions_skips_empty():
@@ -0,0 +1,34 @@
+import pytest
+
+from scribify.exceptions import ChunkingError
+from scribify.planner import max_chunk_seconds, model_max_duration_seconds, plan_chunks
+
+
+def test_plan_single_chunk_for_short_audio():
+    assert plan_chunks(60_000, chunk_size_mb=20, bitrate_kbps=128) == [(0, 60_000)]
+
+
+def test_plan_uses_bitrate_not_source_size():
+    limit_ms = max_chunk_seconds(20, 128) * 1000
+    spans = plan_chunks(3_600_000, chunk_size_mb=20, bitrate_kbps=128)
+
+    assert len(spans) == 3
+    assert spans[0][0] == 0 and spans[-1][1] == 3_600_000
+    assert all(end - start <= limit_ms for start, end in spans)
+
+
+def test_plan_respects_model_duration_limit():
+    spans = plan_chunks(3_000_000, chunk_size_mb=20, bitrate_kbps=32, max_duration_seconds=1400)
+
+    assert len(spans) == 3
+    assert all(end - start <= 1_400_000 for start, end in spans)
+
+
+def test_model_duration_limits():
+    assert model_max_duration_seconds("gpt-4o-mini-transcribe") == 1400
+    assert model_max_duration_seconds("whisper-1") is None
+
+
+def test_invalid_chunk_size_rejected():
+    with pytest.raises(ChunkingError):
+        max_chunk_seconds(0)
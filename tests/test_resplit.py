@@ -0,0 +1,81 @@
+import asyncio
+import os
+
+from scribify.exceptions import ChunkTooLargeError
+from scribify.transcriber import Transcriber
+
+
+class RejectingClient:
+    """Rejects any upload larger than ``limit`` bytes."""
+
+    model = "whisper-1"
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.calls = []
+
+    def transcribe_with_retries(self, source, filename=None):
+        with open(source, "rb") as handle:
+            data = handle.read()
+        self.calls.append(os.path.basename(source))
+        if len(data) > self.limit:
+            raise ChunkTooLargeError("too large")
+        return data.decode(), 0
+
+
+class SplittingChunker:
+    """Treats each chunk's bytes as audio and halves them on request."""
+
+    def __init__(self, tmp_path, chunks):
+        self.tmp_path = tmp_path
+        self.chunks = chunks
+        self.spans = [(0, 8000)]
+        self.cleaned = []
+
+    def chunk_audio(self, file_path, format=None):
+        return self.chunks
+
+    def bisect_chunk(self, source, format=None):
+        with open(source, "rb") as handle:
+            data = handle.read()
+        mid = len(data) // 2
+        pieces = []
+        for idx, (start, end) in enumerate(((0, mid), (mid, len(data)))):
+            path = self.tmp_path / f"{os.path.basename(source)}.{idx}.mp3"
+            path.write_bytes(data[start:end])
+            pieces.append((str(path), start * 1000, end * 1000))
+        return pieces
+
+    def cleanup_chunks(self, chunk_paths):
+        self.cleaned.extend(chunk_paths)
+
+
+def _setup(monkeypatch, tmp_path, text, limit):
+    monkeypatch.setattr("scribify.transcriber.validate_audio_file", lambda *_: None)
+    monkeypatch.setattr("scribify.transcriber.get_file_size_mb", lambda *_: 30)
+    chunk = tmp_path / "chunk_001.mp3"
+    chunk.write_bytes(text.encode())
+    chunker = SplittingChunker(tmp_path, [str(chunk)])
+    client = RejectingClient(limit)
+    return Transcriber(client=client, chunker=chunker, quiet=True), client, chunker
+
+
+def test_rejected_chunk_is_bisected_and_spliced(monkeypatch, tmp_path):
+    transcriber, client, chunker = _setup(monkeypatch, tmp_path, "aaaabbbb", limit=4)
+
+    result = transcriber.transcribe_result("long.mp3")
+
+    assert result.text == "aaaa\nbbbb"
+    assert result.chunks[0].splits == 1
+    assert (result.chunks[0].start_ms, result.chunks[0].end_ms) == (0, 8000)
+    assert len(chunker.cleaned) == 3
+
+
+def test_async_resplit_recurses(monkeypatch, tmp_path):
+    transcriber, client, chunker = _setup(monkeypatch, tmp_path, "aabbccdd", limit=2)
+
+    result = asyncio.run(transcriber.transcribe_async("long.mp3"))
+
+    assert result.text == "aa\nbb\ncc\ndd"
+    assert result.chunks[0].splits == 3
+    assert len(client.calls) == 7
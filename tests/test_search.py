@@ -0,0 +1,82 @@
+import os
+
+from click.testing import CliRunner
+
+from scribify.cli import main
+from scribify.result import ChunkResult, TranscriptionResult
+from scribify.search import TranscriptIndex, fts_query
+
+
+def _chunked(*texts):
+    chunks = [
+        ChunkResult(index=i, text=text, seconds=0.0, start_ms=i * 60000, end_ms=(i + 1) * 60000)
+        for i, text in enumerate(texts)
+    ]
+    return TranscriptionResult(text="\n".join(texts), chunks=chunks)
+
+
+def test_search_ranks_jobs_with_chunk_positions(tmp_path):
+    index = TranscriptIndex(str(tmp_path / "index.sqlite3"))
+    index.add("call", _chunked("hello there", "the invoice total was wrong", "invoice invoice"))
+    index.add("memo", "a memo that mentions one invoice among many other words")
+    index.add("other", "nothing relevant")
+
+    hits = index.search("invoice")
+
+    assert [hit.job_id for hit in hits] == ["call", "memo"]
+    assert (hits[0].start_ms, hits[0].end_ms) == (120000, 180000)
+    assert "[invoice]" in hits[0].snippet
+    assert hits[1].start_ms is None
+    assert index.search("invoice wrong")[0].start_ms == 60000
+    assert index.search("invo*")[0].job_id == "call"
+    assert index.search("missing") == []
+
+
+def test_reindexing_replaces_previous_entry(tmp_path):
+    index = TranscriptIndex(str(tmp_path / "index.sqlite3"))
+    index.add("job", "first draft")
+    index.add("job", "second draft")
+
+    assert len(index) == 1
+    assert index.search("first") == []
+    assert [hit.job_id for hit in index.search("draft")] == ["job"]
+
+    index.remove("job")
+    assert index.search("draft") == []
+
+
+def test_sync_directory_is_incremental(tmp_path):
+    results = tmp_path / "results"
+    results.mkdir()
+    (results / "a.txt").write_text("alpha transcript", encoding="utf-8")
+    (results / "b.txt").write_text("beta transcript", encoding="utf-8")
+    (results / "index.sqlite3-wal").write_text("", encoding="utf-8")
+    index = TranscriptIndex(str(tmp_path / "index.sqlite3"))
+
+    assert index.sync_directory(str(results)) == 2
+    assert index.sync_directory(str(results)) == 0
+
+    (results / "a.txt").write_text("gamma transcript", encoding="utf-8")
+    os.utime(results / "a.txt", (1, 1))
+    assert index.sync_directory(str(results)) == 1
+    assert index.search("gamma")[0].job_id == "a"
+
+
+def test_query_punctuation_is_not_syntax():
+    assert fts_query('don\'t "stop" AND-or') == '"don\'t" """stop""" "AND-or"'
+    assert fts_query("*") == ""
+
+
+def test_search_command(tmp_path):
+    results = tmp_path / "results"
+    results.mkdir()
+    (results / "job1.txt").write_text("quarterly revenue discussion", encoding="utf-8")
+    index_path = str(tmp_path / "index.sqlite3")
+
+    output = CliRunner().invoke(
+        main, ["search", "--index", index_path, "--sync", str(results), "revenue"]
+    )
+
+    assert output.exit_code == 0
+    assert "job1" in output.output
+    assert "[revenue]" in output.output
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+HEAVY_MODULES = ("openai", "pydub", "rich", "tenacity", "dotenv")
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+
+
+def test_help_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "from scribify.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "sys.stderr.write('LOADED=' + ','.join(loaded))\n"
+    )
+    proc = _run(code)
+    loaded = proc.stderr.rsplit("LOADED=", 1)[1].strip()
+    assert loaded == ""
+
+
+def test_cli_import_time_budget():
+    proc = _run("import scribify.cli")
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "scribify.cli":
+            cumulative_us = int(parts[1])
+    assert cumulative_us is not None
+    assert cumulative_us / 1_000_000 < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,81 @@
+import io
+
+import pytest
+
+from scribify import streaming as streaming_module
+from scribify.exceptions import ChunkingError
+from scribify.frames import parse_mp3_header
+from scribify.transcriber import Transcriber
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames of 1152 samples.
+FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\0" * 413
+
+
+class FakeProcess:
+    def __init__(self, payload, stderr=b"", exit_code=0):
+        self.stdout = io.BytesIO(payload)
+        self.stderr = io.BytesIO(stderr)
+        self.exit_code = exit_code
+        self.returncode = None
+
+    def wait(self):
+        self.returncode = self.exit_code
+        return self.exit_code
+
+    def poll(self):
+        return self.returncode
+
+
+def test_parse_mp3_header():
+    header = parse_mp3_header(FRAME)
+
+    assert header.length == 417
+    assert header.samples == 1152
+    assert header.sample_rate == 44100
+    assert parse_mp3_header(b"\0" * 8) is None
+
+
+def test_stream_is_cut_on_frame_boundaries(monkeypatch):
+    streamer = streaming_module.StreamingChunker()
+    streamer.chunk_bytes = 417 * 4
+    monkeypatch.setattr(streamer, "_spawn", lambda stream: FakeProcess(FRAME * 10))
+
+    chunks = list(streamer.iter_chunks(io.BytesIO()))
+
+    assert [len(data) // 417 for data, _, _ in chunks] == [4, 4, 2]
+    assert chunks[0][1] == 0
+    assert chunks[1][1] == chunks[0][2] == int(4 * 1152 / 44100 * 1000)
+
+
+def test_failure_reports_tail_of_stderr(monkeypatch):
+    streamer = streaming_module.StreamingChunker()
+    log = b"".join(b"warning %d\n" % i for i in range(5000)) + b"Invalid data found\n"
+    monkeypatch.setattr(streamer, "_spawn", lambda stream: FakeProcess(b"", log, exit_code=1))
+
+    with pytest.raises(ChunkingError) as excinfo:
+        list(streamer.iter_chunks(io.BytesIO()))
+
+    message = str(excinfo.value)
+    assert message.endswith("Invalid data found")
+    assert "warning 0\n" not in message
+
+
+def test_transcribe_stream_uploads_chunks_in_order(monkeypatch):
+    pieces = [(b"one", 0, 1000), (b"two", 1000, 2000), (b"three", 2000, 2500)]
+
+    def fake_iter_chunks(self, stream):
+        yield from pieces
+
+    monkeypatch.setattr(streaming_module.StreamingChunker, "iter_chunks", fake_iter_chunks)
+
+    class Client:
+        model = "whisper-1"
+
+        def transcribe_with_retries(self, source, filename=None):
+            return source.decode(), 0
+
+    result = Transcriber(client=Client(), quiet=True).transcribe_stream(io.BytesIO())
+
+    assert result.text == "one\ntwo\nthree"
+    assert [chunk.end_ms for chunk in result.chunks] == [1000, 2000, 2500]
+    assert result.bytes_uploaded == 11
@@ -2,7 +2,7 @@ import pytest
 
 pytest.importorskip("openai")
 
-from whisper_cli.transcriber import Transcriber
+from scribify.transcriber import Transcriber
 
 
 class DummyClient:
@@ -27,8 +27,8 @@ class DummyChunker:
 
 
 def test_transcriber_small_file(monkeypatch):
-    monkeypatch.setattr("whisper_cli.transcriber.validate_audio_file", lambda *_: None)
-    monkeypatch.setattr("whisper_cli.transcriber.get_file_size_mb", lambda *_: 1)
+    monkeypatch.setattr("scribify.transcriber.validate_audio_file", lambda *_: None)
+    monkeypatch.setattr("scribify.transcriber.get_file_size_mb", lambda *_: 1)
 
     client = DummyClient()
     transcriber = Transcriber(client=client, quiet=True)
@@ -39,8 +39,8 @@ def test_transcriber_small_file(monkeypatch):
 
 
 def test_transcriber_chunked(monkeypatch, tmp_path):
-    monkeypatch.setattr("whisper_cli.transcriber.validate_audio_file", lambda *_: None)
-    monkeypatch.setattr("whisper_cli.transcriber.get_file_size_mb", lambda *_: 30)
+    monkeypatch.setattr("scribify.transcriber.validate_audio_file", lambda *_: None)
+    monkeypatch.setattr("scribify.transcriber.get_file_size_mb", lambda *_: 30)
 
     chunks = [str(tmp_path / "chunk1.mp3"), str(tmp_path / "chunk2.mp3")]
     chunker = DummyChunker(chunks)
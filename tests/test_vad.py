@@ -0,0 +1,64 @@
+import math
+import struct
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pydub")
+
+from pydub import AudioSegment
+
+from scribify import vad as vad_module
+from scribify.vad import TimeMap, speech_spans, strip_silence
+
+RATE = 8000
+
+
+def _segment(pattern):
+    samples = []
+    for kind, ms in pattern:
+        count = RATE * ms // 1000
+        if kind == "tone":
+            samples.extend(int(8000 * math.sin(2 * math.pi * 440 * i / RATE)) for i in range(count))
+        else:
+            samples.extend([0] * count)
+    data = struct.pack(f"<{len(samples)}h", *samples)
+    return AudioSegment(data=data, sample_width=2, frame_rate=RATE, channels=1)
+
+
+def test_long_silence_is_cut_with_padding():
+    audio = _segment([("tone", 990), ("silence", 3000), ("tone", 990)])
+
+    spans = speech_spans(audio, frame_ms=30, min_silence_ms=1000, padding_ms=240)
+
+    assert spans == [(0, 1230), (3750, 4980)]
+
+
+def test_short_pauses_are_kept():
+    audio = _segment([("tone", 990), ("silence", 600), ("tone", 990)])
+
+    assert speech_spans(audio) == [(0, len(audio))]
+
+
+def test_energy_blocks_do_not_change_spans(monkeypatch):
+    audio = _segment([("tone", 990), ("silence", 3000), ("tone", 500), ("silence", 1500)])
+    expected = speech_spans(audio)
+
+    monkeypatch.setattr(vad_module, "_RMS_BLOCK_FRAMES", 7)
+
+    assert speech_spans(audio) == expected
+
+
+def test_strip_silence_time_map_restores_original_time():
+    audio = _segment([("tone", 990), ("silence", 3000), ("tone", 990)])
+
+    trimmed, time_map = strip_silence(audio, frame_ms=30, min_silence_ms=1000, padding_ms=240)
+
+    assert len(trimmed) == time_map.trimmed_ms == 1230 + 1230
+    assert time_map.to_original(0) == 0
+    assert time_map.to_original(1230) == 3750
+    assert time_map.to_original(2000) == 4520
+
+
+def test_empty_time_map_is_identity():
+    assert TimeMap().to_original(1234) == 1234
@@ -0,0 +1,139 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from scribify import watcher as watcher_module
+from scribify.watcher import FolderWatcher
+
+
+class DummyTranscriber:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def transcribe(self, path):
+        with self.lock:
+            self.calls.append(path)
+        with open(path, "rb") as handle:
+            return handle.read().decode().upper()
+
+
+def _run_until(watcher, condition, timeout=5.0):
+    stop = threading.Event()
+    thread = threading.Thread(target=watcher.run, args=(stop,))
+    thread.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _watch(tmp_path, use_inotify):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    transcriber = DummyTranscriber()
+    watcher = FolderWatcher(transcriber, str(inbox), poll_interval=0.05, use_inotify=use_inotify)
+    return inbox, transcriber, watcher
+
+
+def test_polling_transcribes_and_moves_files(tmp_path):
+    inbox, transcriber, watcher = _watch(tmp_path, use_inotify=False)
+    (inbox / "a.mp3").write_bytes(b"hello")
+    (inbox / "notes.txt").write_bytes(b"ignored")
+
+    _run_until(watcher, lambda: (inbox / "transcripts" / "a.txt").exists())
+
+    assert (inbox / "transcripts" / "a.txt").read_text() == "HELLO"
+    assert (inbox / "processed" / "a.mp3").exists()
+    assert (inbox / "notes.txt").exists()
+
+
+def test_duplicate_content_is_transcribed_once(tmp_path):
+    inbox, transcriber, watcher = _watch(tmp_path, use_inotify=False)
+    (inbox / "a.mp3").write_bytes(b"same")
+    (inbox / "b.mp3").write_bytes(b"same")
+
+    transcripts = inbox / "transcripts"
+    _run_until(
+        watcher, lambda: (transcripts / "a.txt").exists() and (transcripts / "b.txt").exists()
+    )
+
+    assert len(transcriber.calls) == 1
+    assert (transcripts / "b.txt").read_text() == "SAME"
+
+
+def test_same_stem_gets_its_own_transcript(tmp_path):
+    inbox, transcriber, watcher = _watch(tmp_path, use_inotify=False)
+    (inbox / "call.mp3").write_bytes(b"first")
+    (inbox / "call.wav").write_bytes(b"second")
+
+    transcripts = inbox / "transcripts"
+    _run_until(watcher, lambda: len(list(transcripts.glob("*.txt"))) == 2)
+
+    texts = sorted(path.read_text() for path in transcripts.glob("*.txt"))
+    assert texts == ["FIRST", "SECOND"]
+    assert sorted(path.name for path in transcripts.glob("*.txt")) == ["call-1.txt", "call.txt"]
+
+
+def test_unmovable_failure_is_not_retried(tmp_path, monkeypatch):
+    inbox, transcriber, watcher = _watch(tmp_path, use_inotify=False)
+
+    def fail(path):
+        transcriber.calls.append(path)
+        raise RuntimeError("bad audio")
+
+    def cannot_move(path, directory):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(transcriber, "transcribe", fail)
+    monkeypatch.setattr(watcher_module, "_move_aside", cannot_move)
+    (inbox / "bad.mp3").write_bytes(b"bad")
+
+    _run_until(watcher, lambda: len(transcriber.calls) > 1, timeout=0.6)
+
+    assert len(transcriber.calls) == 1
+    assert (inbox / "bad.mp3").exists()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_picks_up_new_files(tmp_path):
+    inbox, transcriber, watcher = _watch(tmp_path, use_inotify=True)
+
+    def write_later():
+        time.sleep(0.2)
+        (inbox / "late.wav").write_bytes(b"late")
+
+    writer = threading.Thread(target=write_later)
+    writer.start()
+    _run_until(watcher, lambda: (inbox / "transcripts" / "late.txt").exists())
+    writer.join()
+
+    assert (inbox / "transcripts" / "late.txt").read_text() == "LATE"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_file_still_being_written_at_startup_waits_for_close(tmp_path):
+    inbox, transcriber, watcher = _watch(tmp_path, use_inotify=True)
+    handle = open(inbox / "live.mp3", "wb")
+    handle.write(b"part")
+    handle.flush()
+
+    def keep_writing():
+        for _ in range(10):
+            time.sleep(0.02)
+            handle.write(b"-more")
+            handle.flush()
+        handle.close()
+
+    writer = threading.Thread(target=keep_writing)
+    writer.start()
+    _run_until(watcher, lambda: (inbox / "transcripts" / "live.txt").exists())
+    writer.join()
+
+    assert (inbox / "transcripts" / "live.txt").read_text() == "PART" + "-MORE" * 10
+    assert len(transcriber.calls) == 1
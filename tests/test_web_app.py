@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+import web_app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(web_app, "transcription_jobs", {})
+    monkeypatch.setattr(web_app, "inflight_jobs", {})
+    return TestClient(web_app.app)
+
+
+def test_identical_uploads_share_one_job(client, monkeypatch):
+    started = []
+
+    async def fake_process(job_id, file_path, dedupe_key=None):
+        started.append(job_id)
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(web_app, "process_transcription", fake_process)
+
+    first = client.post("/transcribe", files={"file": ("a.mp3", b"same audio")}).json()
+    second = client.post("/transcribe", files={"file": ("b.mp3", b"same audio")}).json()
+    other = client.post("/transcribe", files={"file": ("c.mp3", b"other audio")}).json()
+
+    assert started == [first["job_id"], other["job_id"]]
+    assert second["job_id"] != first["job_id"]
+
+    web_app.transcription_jobs[first["job_id"]].update(status="completed", result="hello")
+    status = client.get(f"/status/{second['job_id']}").json()
+    assert status["status"] == "completed"
+    assert status["result"] == "hello"
+
+
+def test_finished_job_releases_dedupe_key(monkeypatch, tmp_path):
+    monkeypatch.setattr(web_app, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(web_app, "inflight_jobs", {"key": "job"})
+    monkeypatch.setattr(web_app, "transcription_jobs", {"job": {"status": "processing"}})
+
+    class FailingTranscriber:
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(web_app, "Transcriber", FailingTranscriber)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    asyncio.run(web_app.process_transcription("job", str(tmp_path / "missing.mp3"), "key"))
+
+    assert web_app.inflight_jobs == {}
+    assert web_app.transcription_jobs["job"]["status"] == "failed"
+
+
+def test_ui_is_compressed_and_revalidated(client):
+    page = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert page.status_code == 200
+    assert page.headers["content-encoding"] == "gzip"
+    assert page.headers["cache-control"] == "no-cache"
+    assert "/assets/app." in page.text
+
+    again = client.get("/", headers={"If-None-Match": page.headers["etag"]})
+    assert again.status_code == 304
+
+    asset = next(iter(web_app.ui_assets))
+    response = client.get(f"/assets/{asset}")
+    assert "immutable" in response.headers["cache-control"]
+    assert client.get("/assets/missing.js").status_code == 404
+
+
+def test_result_download_supports_ranges_and_etags(client):
+    text = "word " * 200
+    web_app.transcription_jobs["job"] = {"status": "completed", "result": text, "error": None}
+
+    full = client.get("/result/job", headers={"Accept-Encoding": "identity"})
+    assert full.status_code == 200
+    assert full.text == text
+    assert "content-encoding" not in full.headers
+
+    compressed = client.get("/result/job", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.text == text
+    assert compressed.headers["etag"] != full.headers["etag"]
+
+    partial = client.get("/result/job", headers={"Range": "bytes=5-9", "Accept-Encoding": "gzip"})
+    assert partial.status_code == 206
+    assert partial.content == b"word "
+    assert partial.headers["content-range"] == f"bytes 5-9/{len(text)}"
+
+    stale = client.get("/result/job", headers={"Range": "bytes=5-9", "If-Range": '"old"'})
+    assert stale.status_code == 200
+
+    unsatisfiable = client.get("/result/job", headers={"Range": f"bytes={len(text)}-"})
+    assert unsatisfiable.status_code == 416
+
+    cached = client.get("/result/job", headers={"If-None-Match": compressed.headers["etag"]})
+    assert cached.status_code == 304
+
+    status = client.get("/status/job?include_result=false").json()
+    assert status["result"] is None
+    assert status["result_url"] == "/result/job"
+
+
+def test_result_of_unfinished_job(client):
+    web_app.transcription_jobs["job"] = {"status": "processing", "result": None, "error": None}
+
+    assert client.get("/result/job").status_code == 409
+    assert client.get("/result/other").status_code == 404
+
+
+def test_completed_jobs_are_searchable(client, monkeypatch, tmp_path):
+    from scribify.admission import ResourceEstimate
+    from scribify.result import TranscriptionResult
+    from scribify.search import TranscriptIndex
+
+    monkeypatch.setattr(web_app, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(web_app, "search_index", TranscriptIndex(str(tmp_path / "index.sqlite3")))
+    web_app.transcription_jobs["job"] = {"status": "processing", "result": None, "error": None}
+
+    class FakeTranscriber:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe_result(self, file_path):
+            return TranscriptionResult(text="budget meeting notes")
+
+    monkeypatch.setattr(web_app, "Transcriber", FakeTranscriber)
+    monkeypatch.setattr(
+        web_app, "estimate_job", lambda *args: ResourceEstimate(memory_bytes=1, disk_bytes=1)
+    )
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    asyncio.run(web_app.process_transcription("job", str(tmp_path / "audio.mp3")))
+
+    response = client.get("/search", params={"q": "budget"}).json()
+    assert [hit["job_id"] for hit in response["results"]] == ["job"]
+    assert "[budget]" in response["results"][0]["snippet"]
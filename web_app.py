@@ -1,344 +1,155 @@
 import asyncio
+import hashlib
+import logging
 import os
 import uuid
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi import FastAPI, File, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
-from scribify.api_client import OpenAITranscriptionClient
+from scribify.admission import AdmissionController, estimate_job
+from scribify.backends import TranscriptionBackend, create_backend
 from scribify.config import Config
+from scribify.constants import (
+    DEFAULT_DISK_BUDGET_MB,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_MODEL,
+    DISK_BUDGET_ENV_VAR,
+    MEMORY_BUDGET_ENV_VAR,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_INDEX_ENV_VAR,
+)
+from scribify.http_cache import (
+    Representations,
+    etag_matches,
+    negotiate_encoding,
+    parse_range,
+    precompress,
+)
+from scribify.search import TranscriptIndex
 from scribify.transcriber import Transcriber
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Scribify API", version="1.0.0")
 
 UPLOAD_DIR = Path("/tmp/scribify-uploads")
 RESULTS_DIR = Path("/tmp/scribify-results")
+STATIC_DIR = Path(__file__).parent / "static"
 UPLOAD_DIR.mkdir(exist_ok=True)
 RESULTS_DIR.mkdir(exist_ok=True)
 
 transcription_jobs: Dict[str, Dict] = {}
+# Upload content hash + model -> job_id of the transcription already running for it.
+inflight_jobs: Dict[str, str] = {}
+clients: Dict[str, TranscriptionBackend] = {}
+
+
+def _job_model() -> str:
+    return os.getenv("OPENAI_MODEL") or DEFAULT_MODEL
+
+
+def _client_for(config: Config) -> TranscriptionBackend:
+    # One client per model, so jobs share its connection pool and any
+    # SCRIBIFY_CASSETTE recording or replay.
+    if config.model not in clients:
+        clients[config.model] = create_backend(config)
+    return clients[config.model]
+
+
+def _budget_bytes(env_var: str, default_mb: int) -> int:
+    return int(os.getenv(env_var) or default_mb) * 1024 * 1024
+
+
+# Finished transcripts are indexed as they complete; `scribify search --sync`
+# backfills results written before the index existed.
+search_index = TranscriptIndex(
+    os.getenv(SEARCH_INDEX_ENV_VAR) or str(RESULTS_DIR / "transcripts.sqlite3")
+)
+
+# Jobs beyond what the container's RAM and /tmp tmpfs can hold wait as "queued".
+admission = AdmissionController(
+    memory_budget_bytes=_budget_bytes(MEMORY_BUDGET_ENV_VAR, DEFAULT_MEMORY_BUDGET_MB),
+    disk_budget_bytes=_budget_bytes(DISK_BUDGET_ENV_VAR, DEFAULT_DISK_BUDGET_MB),
+)
+
+
+def _load_ui() -> Tuple[Representations, Dict[str, Tuple[str, Representations]]]:
+    # CSS/JS get content-hashed URLs so they can be cached forever; the page
+    # itself is revalidated against its ETag.
+    assets: Dict[str, Tuple[str, Representations]] = {}
+    page = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+    for name, media_type in (("app.css", "text/css"), ("app.js", "text/javascript")):
+        body = precompress((STATIC_DIR / name).read_bytes())
+        stem, ext = name.rsplit(".", 1)
+        digest = body.etag.strip('"')[:12]
+        fingerprinted = f"{stem}.{digest}.{ext}"
+        assets[fingerprinted] = (f"{media_type}; charset=utf-8", body)
+        page = page.replace(f"{{{{{stem}_{ext}}}}}", f"/assets/{fingerprinted}")
+    return precompress(page.encode("utf-8")), assets
+
+
+def _cached_response(
+    request: Request, body: Representations, media_type: str, headers: Dict[str, str]
+) -> Response:
+    """Serve ``body`` honouring If-None-Match, Range/If-Range and Accept-Encoding."""
+    headers = {**headers, "Vary": "Accept-Encoding", "Accept-Ranges": "bytes"}
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), body.encoded)
+
+    if etag_matches(request.headers.get("if-none-match"), body.etags()):
+        headers["ETag"] = body.variant_etag(encoding)
+        return Response(status_code=304, headers=headers)
+
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range == body.etag:
+        # Ranges address the uncompressed bytes.
+        size = len(body.identity)
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+        if byte_range is not None:
+            first, last = byte_range
+            headers["ETag"] = body.etag
+            headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+            return Response(
+                content=body.identity[first : last + 1],
+                status_code=206,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    headers["ETag"] = body.variant_etag(encoding)
+    if encoding is None:
+        return Response(content=body.identity, media_type=media_type, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=body.encoded[encoding], media_type=media_type, headers=headers)
+
+
+ui_page, ui_assets = _load_ui()
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Serve the main HTML interface"""
-    html_content = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Scribify - Audio Transcription</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                padding: 20px;
-            }
-
-            .container {
-                background: white;
-                border-radius: 20px;
-                box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-                padding: 40px;
-                max-width: 600px;
-                width: 100%;
-            }
-
-            h1 {
-                color: #333;
-                margin-bottom: 10px;
-                font-size: 28px;
-            }
-
-            .subtitle {
-                color: #666;
-                margin-bottom: 30px;
-                font-size: 14px;
-            }
-
-            .upload-area {
-                border: 2px dashed #667eea;
-                border-radius: 10px;
-                padding: 40px;
-                text-align: center;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                margin-bottom: 20px;
-            }
-
-            .upload-area:hover {
-                border-color: #764ba2;
-                background: #f8f9ff;
-            }
-
-            .upload-area.dragover {
-                border-color: #764ba2;
-                background: #f0f3ff;
-            }
-
-            input[type="file"] {
-                display: none;
-            }
-
-            .file-info {
-                margin-top: 20px;
-                padding: 15px;
-                background: #f8f9ff;
-                border-radius: 8px;
-                font-size: 14px;
-                color: #555;
-            }
-
-            button {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                cursor: pointer;
-                width: 100%;
-                transition: transform 0.2s ease, box-shadow 0.2s ease;
-            }
-
-            button:hover:not(:disabled) {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-
-            button:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-            }
-
-            .status {
-                margin-top: 20px;
-                padding: 15px;
-                border-radius: 8px;
-                font-size: 14px;
-            }
-
-            .status.processing {
-                background: #fff3cd;
-                border: 1px solid #ffc107;
-                color: #856404;
-            }
-
-            .status.success {
-                background: #d4edda;
-                border: 1px solid #28a745;
-                color: #155724;
-            }
-
-            .status.error {
-                background: #f8d7da;
-                border: 1px solid #dc3545;
-                color: #721c24;
-            }
-
-            .result {
-                margin-top: 20px;
-                padding: 20px;
-                background: #f8f9fa;
-                border-radius: 8px;
-                max-height: 300px;
-                overflow-y: auto;
-                white-space: pre-wrap;
-                font-family: monospace;
-                font-size: 13px;
-                line-height: 1.6;
-            }
-
-            .spinner {
-                border: 3px solid #f3f3f3;
-                border-top: 3px solid #667eea;
-                border-radius: 50%;
-                width: 40px;
-                height: 40px;
-                animation: spin 1s linear infinite;
-                margin: 20px auto;
-            }
-
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-
-            .download-btn {
-                margin-top: 15px;
-                background: #28a745;
-            }
-
-            .upload-icon {
-                font-size: 48px;
-                margin-bottom: 15px;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🎙️ Scribify</h1>
-            <p class="subtitle">Upload your audio file to get it transcribed using OpenAI's Whisper model</p>
-
-            <div class="upload-area" id="uploadArea">
-                <div class="upload-icon">📁</div>
-                <div>
-                    <strong>Click to upload</strong> or drag and drop<br>
-                    <small>Supported formats: MP3, WAV, M4A, AAC, FLAC, OGG, WMA</small>
-                </div>
-                <input type="file" id="fileInput" accept="audio/*">
-            </div>
-
-            <div id="fileInfo" class="file-info" style="display: none;"></div>
-
-            <button id="uploadBtn" disabled>Upload & Transcribe</button>
-
-            <div id="status" style="display: none;"></div>
-            <div id="result" class="result" style="display: none;"></div>
-        </div>
-
-        <script>
-            const uploadArea = document.getElementById('uploadArea');
-            const fileInput = document.getElementById('fileInput');
-            const fileInfo = document.getElementById('fileInfo');
-            const uploadBtn = document.getElementById('uploadBtn');
-            const status = document.getElementById('status');
-            const result = document.getElementById('result');
-
-            let selectedFile = null;
-            let currentJobId = null;
-
-            uploadArea.addEventListener('click', () => fileInput.click());
-
-            uploadArea.addEventListener('dragover', (e) => {
-                e.preventDefault();
-                uploadArea.classList.add('dragover');
-            });
-
-            uploadArea.addEventListener('dragleave', () => {
-                uploadArea.classList.remove('dragover');
-            });
-
-            uploadArea.addEventListener('drop', (e) => {
-                e.preventDefault();
-                uploadArea.classList.remove('dragover');
-
-                const files = e.dataTransfer.files;
-                if (files.length > 0) {
-                    handleFileSelect(files[0]);
-                }
-            });
-
-            fileInput.addEventListener('change', (e) => {
-                if (e.target.files.length > 0) {
-                    handleFileSelect(e.target.files[0]);
-                }
-            });
-
-            function handleFileSelect(file) {
-                selectedFile = file;
-                fileInfo.textContent = `Selected: ${file.name} (${(file.size / 1024 / 1024).toFixed(2)} MB)`;
-                fileInfo.style.display = 'block';
-                uploadBtn.disabled = false;
-                status.style.display = 'none';
-                result.style.display = 'none';
-            }
-
-            uploadBtn.addEventListener('click', async () => {
-                if (!selectedFile) return;
-
-                uploadBtn.disabled = true;
-                status.className = 'status processing';
-                status.style.display = 'block';
-                status.innerHTML = '<div class="spinner"></div><div>Uploading and transcribing...</div>';
-                result.style.display = 'none';
-
-                const formData = new FormData();
-                formData.append('file', selectedFile);
-
-                try {
-                    const response = await fetch('/transcribe', {
-                        method: 'POST',
-                        body: formData
-                    });
-
-                    if (!response.ok) {
-                        throw new Error(`Upload failed: ${response.statusText}`);
-                    }
+    return _cached_response(
+        request, ui_page, "text/html; charset=utf-8", {"Cache-Control": "no-cache"}
+    )
 
-                    const data = await response.json();
-                    currentJobId = data.job_id;
 
-                    pollJobStatus(currentJobId);
-                } catch (error) {
-                    status.className = 'status error';
-                    status.innerHTML = `❌ Error: ${error.message}`;
-                    uploadBtn.disabled = false;
-                }
-            });
-
-            async function pollJobStatus(jobId) {
-                try {
-                    const response = await fetch(`/status/${jobId}`);
-                    const data = await response.json();
-
-                    if (data.status === 'completed') {
-                        status.className = 'status success';
-                        status.innerHTML = '✅ Transcription completed!';
-                        result.style.display = 'block';
-                        result.textContent = data.result;
-
-                        const downloadBtn = document.createElement('button');
-                        downloadBtn.className = 'download-btn';
-                        downloadBtn.textContent = '📥 Download Transcript';
-                        downloadBtn.onclick = () => {
-                            const blob = new Blob([data.result], { type: 'text/plain' });
-                            const url = URL.createObjectURL(blob);
-                            const a = document.createElement('a');
-                            a.href = url;
-                            a.download = 'transcript.txt';
-                            a.click();
-                            URL.revokeObjectURL(url);
-                        };
-
-                        if (!document.querySelector('.download-btn')) {
-                            result.parentElement.insertBefore(downloadBtn, result.nextSibling);
-                        }
-
-                        uploadBtn.disabled = false;
-                    } else if (data.status === 'failed') {
-                        status.className = 'status error';
-                        status.innerHTML = `❌ Transcription failed: ${data.error}`;
-                        uploadBtn.disabled = false;
-                    } else {
-                        setTimeout(() => pollJobStatus(jobId), 2000);
-                    }
-                } catch (error) {
-                    status.className = 'status error';
-                    status.innerHTML = `❌ Error checking status: ${error.message}`;
-                    uploadBtn.disabled = false;
-                }
-            }
-        </script>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+@app.get("/assets/{name}")
+async def get_asset(name: str, request: Request):
+    """Serve a fingerprinted UI asset"""
+    if name not in ui_assets:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    media_type, body = ui_assets[name]
+    return _cached_response(
+        request, body, media_type, {"Cache-Control": "public, max-age=31536000, immutable"}
+    )
 
 
 @app.post("/transcribe")
@@ -349,8 +160,24 @@ async def transcribe_audio(file: UploadFile = File(...)):
     file_path = UPLOAD_DIR / f"{job_id}_{file.filename}"
 
     try:
+        content = await file.read()
+        digest = await asyncio.to_thread(lambda: hashlib.sha256(content).hexdigest())
+        dedupe_key = f"{_job_model()}:{digest}"
+
+        running_job_id = inflight_jobs.get(dedupe_key)
+        if running_job_id is not None:
+            # Identical upload already in flight: share its job record so this
+            # request sees the same progress and result without new work.
+            transcription_jobs[job_id] = transcription_jobs[running_job_id]
+            return JSONResponse(
+                content={
+                    "job_id": job_id,
+                    "status": transcription_jobs[job_id]["status"],
+                    "message": "Attached to identical transcription in progress",
+                }
+            )
+
         with open(file_path, "wb") as f:
-            content = await file.read()
             f.write(content)
 
         transcription_jobs[job_id] = {
@@ -359,8 +186,9 @@ async def transcribe_audio(file: UploadFile = File(...)):
             "result": None,
             "error": None,
         }
+        inflight_jobs[dedupe_key] = job_id
 
-        asyncio.create_task(process_transcription(job_id, str(file_path)))
+        asyncio.create_task(process_transcription(job_id, str(file_path), dedupe_key))
 
         return JSONResponse(
             content={
@@ -375,28 +203,45 @@ async def transcribe_audio(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def process_transcription(job_id: str, file_path: str):
+async def process_transcription(
+    job_id: str, file_path: str, dedupe_key: Optional[str] = None
+):
     """Background task to process transcription"""
     try:
-        config = Config.load()
-        client = OpenAITranscriptionClient(
-            api_key=config.api_key, model=config.model
+        config = Config.load(model=_job_model())
+        transcriber = Transcriber(client=_client_for(config), quiet=True)
+
+        estimate = await asyncio.to_thread(estimate_job, file_path, config.model)
+        if not admission.fits(estimate) or admission.queued:
+            transcription_jobs[job_id]["status"] = "queued"
+        async with admission.reserve(estimate):
+            transcription_jobs[job_id]["status"] = "processing"
+            transcription = await asyncio.to_thread(transcriber.transcribe_result, file_path)
+        result = transcription.text
+
+        transcription_jobs[job_id]["result_body"] = await asyncio.to_thread(
+            precompress, result.encode("utf-8")
         )
-        transcriber = Transcriber(client=client, quiet=True)
-
-        result = await asyncio.to_thread(transcriber.transcribe, file_path)
-
-        transcription_jobs[job_id]["status"] = "completed"
         transcription_jobs[job_id]["result"] = result
+        transcription_jobs[job_id]["status"] = "completed"
 
         result_path = RESULTS_DIR / f"{job_id}.txt"
         with open(result_path, "w") as f:
             f.write(result)
 
+        try:
+            await asyncio.to_thread(
+                search_index.add, job_id, transcription, os.path.getmtime(result_path)
+            )
+        except Exception as exc:
+            logger.warning("Failed to index transcript %s: %s", job_id, exc)
+
     except Exception as e:
         transcription_jobs[job_id]["status"] = "failed"
         transcription_jobs[job_id]["error"] = str(e)
     finally:
+        if dedupe_key is not None:
+            inflight_jobs.pop(dedupe_key, None)
         if os.path.exists(file_path):
             try:
                 os.remove(file_path)
@@ -405,22 +250,69 @@ async def process_transcription(job_id: str, file_path: str):
 
 
 @app.get("/status/{job_id}")
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, include_result: bool = True):
     """Get the status of a transcription job"""
     if job_id not in transcription_jobs:
         raise HTTPException(status_code=404, detail="Job not found")
 
     job = transcription_jobs[job_id]
+    completed = job["status"] == "completed"
     return JSONResponse(
         content={
             "job_id": job_id,
             "status": job["status"],
-            "result": job["result"],
+            "result": job["result"] if include_result else None,
+            "result_url": f"/result/{job_id}" if completed else None,
             "error": job["error"],
         }
     )
 
 
+@app.get("/result/{job_id}")
+async def get_job_result(job_id: str, request: Request):
+    """Download a finished transcript"""
+    if job_id not in transcription_jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    job = transcription_jobs[job_id]
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail="Transcription not completed")
+    body = job.get("result_body")
+    if body is None:
+        body = job["result_body"] = precompress(job["result"].encode("utf-8"))
+    return _cached_response(
+        request,
+        body,
+        "text/plain; charset=utf-8",
+        {
+            "Cache-Control": "private, max-age=86400, immutable",
+            "Content-Disposition": f'inline; filename="{job_id}.txt"',
+        },
+    )
+
+
+@app.get("/search")
+async def search_transcripts(q: str, limit: int = SEARCH_DEFAULT_LIMIT):
+    """Find transcripts mentioning the query terms, best match first"""
+    limit = max(1, min(limit, 100))
+    hits = await asyncio.to_thread(search_index.search, q, limit)
+    return JSONResponse(
+        content={
+            "query": q,
+            "results": [
+                {
+                    "job_id": hit.job_id,
+                    "snippet": hit.snippet,
+                    "score": hit.score,
+                    "start_ms": hit.start_ms,
+                    "end_ms": hit.end_ms,
+                }
+                for hit in hits
+            ],
+        }
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker"""